@@ -16,18 +16,17 @@ class Node:
         self.name = name
         self.childs = []
         self.path = path
+        self._child_index = {}
 
     def add_child_node(self, child_node):
         self.childs.append(child_node)
+        self._child_index.setdefault(child_node.name, child_node)
 
     def get_childs(self):
         return self.childs
 
     def find_child(self, child_node_name):
-        for child in self.childs:
-            if child.name == child_node_name:
-                return child
-        return None
+        return self._child_index.get(child_node_name)
 
     def child_exists(self, child_node_name):
         for i in range(len(self.childs)):
@@ -66,7 +65,7 @@ class CallTree(Node):
         super().__init__('', cast(Callpath, None))
 
     def add_node(self, node):
-        self.childs.append(node)
+        self.add_child_node(node)
 
     def get_node(self, node_name):
         for i in range(len(self.childs)):
@@ -8,7 +8,7 @@
 import logging
 import warnings
 from itertools import chain
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterable
 
 from marshmallow import fields, validate, pre_load, post_dump
 from packaging.version import Version
@@ -80,6 +80,13 @@ class Experiment:
         else:
             self.measurements[key] = [measurement]
 
+    def extend_measurements(self, callpath: Callpath, metric: Metric, measurements: Iterable[Measurement]):
+        key = (callpath, metric)
+        if key in self.measurements:
+            self.measurements[key].extend(measurements)
+        else:
+            self.measurements[key] = list(measurements)
+
     def delete_measurement(self, callpath: Callpath, metric: Metric):
         key = (callpath,
                metric)
@@ -18,12 +18,142 @@ from marshmallow import fields
 
 from extrap.entities.parameter import Parameter
 from extrap.entities.terms import CompoundTerm, MultiParameterTerm, CompoundTermSchema, MultiParameterTermSchema, \
-    SegmentedTerm
+    SegmentedTerm, SimpleTerm
 from extrap.util.latex_formatting import frmt_scientific_coefficient
 from extrap.util.serialization_schema import BaseSchema, NumberField, NumpyField
 from extrap.util.string_formats import FunctionFormats
 
 
+def _result_buffer(parameter_value: numpy.ndarray, constant_coefficient) -> numpy.ndarray:
+    """
+    Creates the result array for the evaluation of a function and fills it with the constant coefficient.
+    For two-dimensional inputs (one row per parameter) the result has one entry per column.
+    """
+    if parameter_value.ndim == 2:
+        shape = parameter_value.shape[1:]
+    else:
+        shape = parameter_value.shape
+    function_value = numpy.empty(shape, dtype=numpy.float64)
+    function_value.fill(constant_coefficient)
+    return function_value
+
+
+def _single_parameter_value(parameter_value):
+    """
+    Extracts the value of the only parameter, if the parameter value is given as a container of parameter values.
+    """
+    value_type = type(parameter_value)
+    if value_type is float or value_type is int:
+        return parameter_value
+    elif value_type is numpy.ndarray:
+        if parameter_value.ndim > 0 and parameter_value.shape[0] == 1:
+            return parameter_value[0]
+        return parameter_value
+    elif hasattr(parameter_value, '__len__') and (len(parameter_value) == 1 or isinstance(parameter_value, Mapping)):
+        return parameter_value[0]
+    return parameter_value
+
+
+def _term_table(compound_terms: Sequence[CompoundTerm]):
+    """
+    Converts the compound terms into a structure of arrays containing the coefficients, the polynomial exponents and
+    the logarithm exponents of each term.
+    Returns None if a term cannot be described by these values.
+    """
+    num_terms = len(compound_terms)
+    coefficients = numpy.empty(num_terms, dtype=numpy.float64)
+    exponents = numpy.zeros(num_terms, dtype=numpy.float64)
+    log_exponents = numpy.zeros(num_terms, dtype=numpy.float64)
+    for i, t in enumerate(compound_terms):
+        if type(t) is not CompoundTerm:
+            return None
+        coefficients[i] = t.coefficient
+        for s in t.simple_terms:
+            if type(s) is not SimpleTerm:
+                return None
+            if s.term_type == "polynomial":
+                exponents[i] += s._float_exponent
+            else:
+                log_exponents[i] += s._float_exponent
+    return coefficients, exponents, log_exponents
+
+
+def _evaluate_term_table(parameter_value: numpy.ndarray, constant_coefficient, term_table):
+    """
+    Evaluates all terms of a term table at once for a one-dimensional array of parameter values,
+    by broadcasting the parameter values against the exponents of all terms.
+    Powers are only computed for non-zero exponents and the logarithm only if any term requires it.
+    """
+    coefficients, exponents, log_exponents = term_table
+    term_values = numpy.ones((len(coefficients), len(parameter_value)), dtype=numpy.float64)
+    numpy.power(parameter_value, exponents[:, None], out=term_values, where=(exponents != 0)[:, None])
+    if log_exponents.any():
+        log_mask = (log_exponents != 0)[:, None]
+        log_factors = numpy.power(numpy.log2(parameter_value), log_exponents[:, None], where=log_mask)
+        numpy.multiply(term_values, log_factors, out=term_values, where=log_mask)
+    function_value = coefficients @ term_values
+    function_value += constant_coefficient
+    return function_value
+
+
+def _multi_parameter_term_table(compound_terms: Sequence[MultiParameterTerm], dimensions: int):
+    """
+    Converts the multi-parameter terms into a structure of arrays containing the coefficients of each term and
+    the polynomial and logarithm exponents of each term for each parameter.
+    Returns None if a term cannot be described by these values.
+    """
+    num_terms = len(compound_terms)
+    coefficients = numpy.empty(num_terms, dtype=numpy.float64)
+    exponents = numpy.zeros((num_terms, dimensions), dtype=numpy.float64)
+    log_exponents = numpy.zeros((num_terms, dimensions), dtype=numpy.float64)
+    for i, t in enumerate(compound_terms):
+        if type(t) is not MultiParameterTerm:
+            return None
+        coefficient = t.coefficient
+        for param, term in t.parameter_term_pairs:
+            if type(term) is not CompoundTerm or param >= dimensions:
+                return None
+            coefficient *= term.coefficient
+            for s in term.simple_terms:
+                if type(s) is not SimpleTerm:
+                    return None
+                if s.term_type == "polynomial":
+                    exponents[i, param] += s._float_exponent
+                else:
+                    log_exponents[i, param] += s._float_exponent
+        coefficients[i] = coefficient
+    return coefficients, exponents, log_exponents
+
+
+def _evaluate_multi_parameter_term_table(parameter_value: numpy.ndarray, constant_coefficient, term_table):
+    """
+    Evaluates all terms of a multi-parameter term table for an array with one row per parameter.
+    Each term is computed in a scratch buffer that is reused for all terms and then added to the result.
+    Parameters with an exponent of one are multiplied into the scratch buffer directly, other exponents still
+    create a temporary array for the power. Scalar exponents allow NumPy to use multiplications and square roots
+    instead of general powers, and the logarithm of each parameter is only computed once and only if any term
+    requires it.
+    """
+    coefficients, exponents, log_exponents = term_table
+    function_value = numpy.full(parameter_value.shape[1], constant_coefficient, dtype=numpy.float64)
+    term_value = numpy.empty_like(function_value)
+    log_values = {}
+    for i, coefficient in enumerate(coefficients):
+        term_value.fill(coefficient)
+        for param, (exponent, log_exponent) in enumerate(zip(exponents[i], log_exponents[i])):
+            if exponent == 1:
+                term_value *= parameter_value[param]
+            elif exponent != 0:
+                term_value *= parameter_value[param] ** exponent
+            if log_exponent != 0:
+                log_value = log_values.get(param)
+                if log_value is None:
+                    log_value = log_values[param] = numpy.log2(parameter_value[param])
+                term_value *= log_value if log_exponent == 1 else log_value ** log_exponent
+        function_value += term_value
+    return function_value
+
+
 class Function:
     def __init__(self, *compound_terms: CompoundTerm):
         """
@@ -53,10 +183,7 @@ class Function:
         """
 
         if isinstance(parameter_value, numpy.ndarray):
-            shape = parameter_value.shape
-            if len(shape) == 2:
-                shape = (shape[1],)
-            function_value = numpy.full(shape, self.constant_coefficient, dtype=float)
+            function_value = _result_buffer(parameter_value, self.constant_coefficient)
         else:
             function_value = self.constant_coefficient
         for t in self.compound_terms:
@@ -152,6 +279,11 @@ class ConstantFunction(Function):
         self.add_compound_term = None
         self.__iadd__ = None
 
+    def evaluate(self, parameter_value):
+        if isinstance(parameter_value, numpy.ndarray):
+            return _result_buffer(parameter_value, self.constant_coefficient)
+        return self.constant_coefficient
+
     def to_string(self, *_, format: FunctionFormats = None):
         """
         Returns a string representation of the constant function.
@@ -168,8 +300,11 @@ class SingleParameterFunction(Function):
         super().__init__(*compound_terms)
 
     def evaluate(self, parameter_value):
-        if hasattr(parameter_value, '__len__') and (len(parameter_value) == 1 or isinstance(parameter_value, Mapping)):
-            parameter_value = parameter_value[0]
+        parameter_value = _single_parameter_value(parameter_value)
+        if isinstance(parameter_value, np.ndarray) and parameter_value.ndim == 1:
+            term_table = _term_table(self.compound_terms)
+            if term_table is not None:
+                return _evaluate_term_table(parameter_value, self.constant_coefficient, term_table)
         return super().evaluate(parameter_value)
 
 
@@ -214,8 +349,7 @@ class SegmentedFunction(SingleParameterFunction):
         if not self.segments:
             return super().evaluate(parameter_value)
 
-        if hasattr(parameter_value, '__len__') and (len(parameter_value) == 1 or isinstance(parameter_value, Mapping)):
-            parameter_value = parameter_value[0]
+        parameter_value = _single_parameter_value(parameter_value)
 
         if isinstance(parameter_value, np.ndarray):
             function_value = np.ndarray(parameter_value.shape, dtype=float)
@@ -274,6 +408,14 @@ class MultiParameterFunction(Function):
     def __init__(self, *compound_terms: MultiParameterTerm):
         super().__init__(*compound_terms)
 
+    def evaluate(self, parameter_value):
+        if isinstance(parameter_value, numpy.ndarray) and parameter_value.ndim == 2:
+            dimensions = parameter_value.shape[0]
+            term_table = _multi_parameter_term_table(self.compound_terms, dimensions)
+            if term_table is not None:
+                return _evaluate_multi_parameter_term_table(parameter_value, self.constant_coefficient, term_table)
+        return super().evaluate(parameter_value)
+
     def __repr__(self):
         return f"MultiParameterFunction({self.to_string()})"
 
@@ -6,6 +6,7 @@
 # See the LICENSE file in the base directory for details.
 
 import math
+import threading
 import warnings
 from typing import Sequence
 
@@ -13,9 +14,75 @@ import numpy
 from marshmallow import fields
 
 from extrap.entities.functions import Function, MultiParameterFunction, FunctionSchema
-from extrap.entities.measurement import Measurement, Measure
+from extrap.entities.measurement import Measurement, Measure, MeasurementBatch
 from extrap.util.serialization_schema import BaseSchema, NumberField, EnumField, CompatibilityField
 
+_SQRT_EPSILON = math.sqrt(numpy.finfo(float).eps)
+_LOG_POINTS_CACHE_SIZE = 16
+_log_points_cache = {}
+_log_points_lock = threading.Lock()
+
+
+def _log2_points(points: numpy.ndarray) -> numpy.ndarray:
+    """
+    Returns the logarithm (base 2) of the points of a MeasurementBatch.
+    The logarithm is shared by all log terms of all hypotheses fitted to the same measurements.
+    """
+    entry = _log_points_cache.get(id(points))
+    if entry is not None and entry[0] is points:
+        return entry[1]
+
+    log_points = numpy.log2(points)
+    log_points.flags.writeable = False
+    with _log_points_lock:
+        if len(_log_points_cache) >= _LOG_POINTS_CACHE_SIZE:
+            del _log_points_cache[next(iter(_log_points_cache))]
+        _log_points_cache[id(points)] = points, log_points
+    return log_points
+
+
+def _fit_single_term(term_values: numpy.ndarray, values: numpy.ndarray):
+    """
+    Fits the constant coefficient and the coefficient of a single term to the values.
+    After the constant column is projected out, the least squares problem has a closed-form solution, which is much
+    cheaper than the SVD-based solver. Returns None if the problem is ill-conditioned, then the solver is needed.
+    """
+    term_mean = numpy.mean(term_values)
+    centered = term_values - term_mean
+    centered_square_sum = numpy.dot(centered, centered)
+    # the negated comparison also rejects nan values
+    if not centered_square_sum > _SQRT_EPSILON * (len(term_values) + numpy.dot(term_values, term_values)):
+        return None
+    # the centered term values sum up to zero, therefore, the values do not need to be centered
+    coefficient = numpy.dot(centered, values) / centered_square_sum
+    return numpy.mean(values) - coefficient * term_mean, coefficient
+
+
+def _compute_cost_statistics(predicted: numpy.ndarray, actual: numpy.ndarray):
+    """
+    Computes the cost statistics of the predicted values with respect to the actual values.
+    Returns the RSS, the rRSS, the relative error, and the sum and the number of the SMAPE terms.
+    """
+    # only three arrays are allocated, the intermediate results are stored in them in place
+    difference = predicted - actual
+    # dot reduces with BLAS and without creating a temporary array for the squares
+    rss = float(numpy.dot(difference, difference))
+
+    buffer = numpy.divide(difference, actual)
+    r_rss = float(numpy.dot(buffer, buffer))
+
+    absolute_error = numpy.abs(difference, out=difference)
+    relative_error = numpy.divide(absolute_error, actual, out=buffer)
+    re = numpy.mean(relative_error)
+
+    abssum = numpy.abs(actual)
+    abssum += numpy.abs(predicted, out=buffer)
+    # This condition prevents a division by zero, but it is correct: if sum is 0, both `actual` and `predicted`
+    # must have been 0, and in that case the error at this point is 0, so we don't need to add anything.
+    non_zero = abssum != 0.0
+    smape = numpy.divide(absolute_error, abssum, out=absolute_error, where=non_zero)
+    return rss, r_rss, re, numpy.sum(smape, where=non_zero) * 2, numpy.count_nonzero(non_zero)
+
 
 class Hypothesis:
     def __init__(self, function: Function, use_measure):
@@ -111,7 +178,8 @@ class Hypothesis:
         We take into account the minimum data value to make sure that we don't "nullify"
         actually relevant numbers.
         """
-        minimum = min(Measurement.select_measure(training_measurements, self._use_measure))
+        actual = MeasurementBatch.from_measurements(training_measurements).values(self._use_measure)
+        minimum = actual.min()
         if minimum == 0:
             if abs(self.function.constant_coefficient - minimum) < phi:
                 self.function.constant_coefficient = 0
@@ -124,15 +192,15 @@ class Hypothesis:
         Calculates the term contribution of the term with the given term id to see if it is smaller than epsilon.
         """
 
-        actual = numpy.fromiter(Measurement.select_measure(measurements, self._use_measure), float, len(measurements))
-
-        if measurements[0].coordinate.dimensions > 1:
-            points = numpy.array([m.coordinate.as_tuple() for m in measurements]).T
-        else:
-            points = numpy.array([m.coordinate[0] for m in measurements])
+        batch = MeasurementBatch.from_measurements(measurements)
+        points = batch.first_parameter_points if batch.dimensions == 1 else batch.points
+        actual = batch.values(self._use_measure)
 
-        contribution = numpy.abs(term.evaluate(points) / actual)
-        maximum_term_contribution = contribution.max()
+        # the evaluated term is a new array, therefore, it is reused for the contributions
+        contribution = term.evaluate(points)
+        numpy.divide(contribution, actual, out=contribution)
+        numpy.abs(contribution, out=contribution)
+        maximum_term_contribution = float(contribution.max())
         return maximum_term_contribution
 
     def __repr__(self):
@@ -179,7 +247,7 @@ class ConstantHypothesis(Hypothesis):
         """
         Computes the constant_coefficients of the function using the mean.
         """
-        values = numpy.fromiter(Measurement.select_measure(measurements, self._use_measure), float, len(measurements))
+        values = MeasurementBatch.from_measurements(measurements).values(self._use_measure)
         self.function.constant_coefficient = numpy.mean(values)
 
     def compute_cost(self, measurements: Sequence[Measurement]):
@@ -187,29 +255,28 @@ class ConstantHypothesis(Hypothesis):
         Computes the cost of the constant hypothesis using all data points.
         """
         self._AR2 = 1  # TODO: should this be calculated?
-        smape = 0
-        actuals = []
-        for actual in Measurement.select_measure(measurements, self._use_measure):
-            predicted = self.function.constant_coefficient
-            actuals.append(actual)
-
-            difference = predicted - actual
-            self._RSS += difference * difference
-            if actual != 0:
-                relative_difference = difference / actual
-                self._rRSS += relative_difference * relative_difference
-
-                absolute_error = numpy.abs(difference)
-                relative_error = absolute_error / actual
-                self._RE = numpy.mean(relative_error)
-
-            abssum = abs(actual) + abs(predicted)
-            if abssum != 0:
-                smape += abs(difference) / abssum * 2
+        actual = MeasurementBatch.from_measurements(measurements).values(self._use_measure)
+        predicted = self.function.constant_coefficient
+
+        difference = predicted - actual
+        self._RSS = float(numpy.dot(difference, difference))
+
+        non_zero = actual != 0
+        if non_zero.any():
+            relative_difference = difference[non_zero] / actual[non_zero]
+            self._rRSS = float(numpy.dot(relative_difference, relative_difference))
+            # the relative error of the last measurement with a non-zero value is used
+            last = numpy.flatnonzero(non_zero)[-1]
+            self._RE = abs(difference[last]) / actual[last]
+
+        abssum = numpy.abs(actual) + abs(predicted)
+        non_zero = abssum != 0
+        smape = numpy.sum(numpy.abs(difference[non_zero]) / abssum[non_zero]) * 2
 
         self._SMAPE = smape / len(measurements) * 100
-        if numpy.mean(actuals) != 0.0:
-            self._nRSS = math.sqrt(self._RSS) / numpy.mean(actuals)
+        mean = numpy.mean(actual)
+        if mean != 0.0:
+            self._nRSS = math.sqrt(self._RSS) / mean
         else:
             self._nRSS = math.nan
         self._costs_are_calculated = True
@@ -252,27 +319,13 @@ class SingleParameterHypothesis(Hypothesis):
         self._costs_are_calculated = True
 
     def compute_cost(self, measurements: Sequence[Measurement]):
-        points = numpy.array([m.coordinate[0] for m in measurements])
+        batch = MeasurementBatch.from_measurements(measurements)
+        points, actual = batch.first_parameter_points, batch.values(self._use_measure)
         predicted = self.function.evaluate(points)
 
-        actual = numpy.fromiter(Measurement.select_measure(measurements, self._use_measure), float, len(measurements))
-
-        difference = predicted - actual
-        self._RSS = numpy.sum(difference * difference)
+        self._RSS, self._rRSS, self._RE, smape_sum, smape_count = _compute_cost_statistics(predicted, actual)
         self._nRSS = math.sqrt(self._RSS) / numpy.mean(actual)
-
-        relativeDifference = difference / actual
-        self._rRSS = numpy.sum(relativeDifference * relativeDifference)
-
-        absolute_error = numpy.abs(difference)
-        relative_error = absolute_error / actual
-        self._RE = numpy.mean(relative_error)
-
-        abssum = numpy.abs(actual) + numpy.abs(predicted)
-        # This condition prevents a division by zero, but it is correct: if sum is 0, both `actual` and `predicted`
-        # must have been 0, and in that case the error at this point is 0, so we don't need to add anything.
-        smape = numpy.abs(difference[abssum != 0.0]) / abssum[abssum != 0.0] * 2
-        self._SMAPE = numpy.mean(smape) * 100
+        self._SMAPE = smape_sum / smape_count * 100
 
         self._costs_are_calculated = True
 
@@ -289,17 +342,21 @@ class SingleParameterHypothesis(Hypothesis):
         """
         Computes the coefficients of the function using the least squares solution.
         """
-        b_list = numpy.fromiter(Measurement.select_measure(measurements, self._use_measure), float, len(measurements))
-        points = numpy.fromiter((m.coordinate[0] for m in measurements), float, len(measurements))
+        batch = MeasurementBatch.from_measurements(measurements)
+        points, b_list = batch.first_parameter_points, batch.values(self._use_measure)
 
-        a_list = [numpy.ones((1, len(points)))]
-        for compound_term in self.function.compound_terms:
+        compound_terms = self.function.compound_terms
+        if len(compound_terms) == 1:
+            compound_term = compound_terms[0]
             compound_term.coefficient = 1
-            compound_term_value = compound_term.evaluate(points)
-            a_list.append(compound_term_value.reshape(1, -1))
+            solution = _fit_single_term(compound_term.evaluate(points), b_list)
+            if solution is not None:
+                self.function.constant_coefficient, compound_term.coefficient = solution
+                return
+
+        A = self._design_matrix(points)
 
         # solving the lgs for X to get the coefficients
-        A = numpy.concatenate(a_list, axis=0).T
         B = b_list
 
         X, _, _, _ = numpy.linalg.lstsq(A, B, None)
@@ -310,6 +367,80 @@ class SingleParameterHypothesis(Hypothesis):
         for i, compound_term in enumerate(self.function.compound_terms):
             compound_term.coefficient = X[i + 1]
 
+    def compute_cost_cross_validation(self, measurements: Sequence[Measurement], phi):
+        """
+        Computes the cost for the single-parameter model using leave one out crossvalidation.
+        This is equivalent to fitting the coefficients to each training set, cleaning the constant coefficient with
+        phi and calling compute_cost_leave_one_out for each validation measurement. However, the terms are evaluated
+        only once for all measurements and the costs of all validation measurements are computed at once.
+        The coefficients of the function are undefined afterwards.
+        """
+        batch = MeasurementBatch.from_measurements(measurements)
+        points, actual = batch.first_parameter_points, batch.values(self._use_measure)
+        A = self._design_matrix(points)
+        num_points = len(actual)
+
+        # the minimum of each training set is the overall minimum, except for the set without the minimum
+        minimum_index = numpy.argmin(actual)
+        smallest, second_smallest = numpy.partition(actual, 1)[:2]
+
+        predicted = numpy.empty(num_points)
+        training = numpy.ones(num_points, dtype=bool)
+        for i in range(num_points):
+            training[i] = False
+            A_training, actual_training = A[training], actual[training]
+            solution = None
+            if A.shape[1] == 2:
+                solution = _fit_single_term(A_training[:, 1], actual_training)
+            if solution is None:
+                solution, _, _, _ = numpy.linalg.lstsq(A_training, actual_training, None)
+            constant_coefficient = solution[0]
+            # check if the constant coefficient should actually be 0, see clean_constant_coefficient
+            minimum = second_smallest if i == minimum_index else smallest
+            if minimum == 0:
+                if abs(constant_coefficient) < phi:
+                    constant_coefficient = 0
+            elif abs(constant_coefficient / minimum) < phi:
+                constant_coefficient = 0
+            predicted[i] = constant_coefficient + numpy.dot(A[i, 1:], solution[1:])
+            training[i] = True
+
+        difference = predicted - actual
+        # the running RSS enters the nRSS of each validation measurement
+        running_rss = numpy.cumsum(difference * difference)
+        running_rss += self._RSS
+        self._RSS = float(running_rss[-1])
+        training_means = (numpy.sum(actual) - actual) / (num_points - 1)
+        self._nRSS += numpy.sum(numpy.sqrt(running_rss) / training_means) / num_points
+
+        non_zero = actual != 0
+        relative_difference = difference[non_zero] / actual[non_zero]
+        self._RE += numpy.sum(numpy.abs(relative_difference)) / num_points
+        self._rRSS += float(numpy.dot(relative_difference, relative_difference))
+
+        abssum = numpy.abs(actual) + numpy.abs(predicted)
+        non_zero = abssum != 0
+        self._SMAPE += numpy.sum(numpy.abs(difference[non_zero]) / abssum[non_zero] * 2) / num_points * 100
+        self._costs_are_calculated = True
+
+    def _design_matrix(self, points):
+        """
+        Creates the matrix of the linear least squares problem, i.e., a column of ones for the constant coefficient and
+        a column for each compound term. Resets the coefficients of the compound terms to one.
+        """
+        compound_terms = self.function.compound_terms
+        # the columns of the matrix are filled one after another, therefore, it is stored column-major
+        A = numpy.empty((len(points), len(compound_terms) + 1), order='F')
+        A[:, 0] = 1
+        log_points = None
+        for i, compound_term in enumerate(compound_terms, 1):
+            compound_term.coefficient = 1
+            # the logarithm of the points is computed once and shared by all terms and hypotheses
+            if log_points is None and compound_term.has_logarithm():
+                log_points = _log2_points(points)
+            A[:, i] = compound_term.evaluate(points, log_points)
+        return A
+
 
 class MultiParameterHypothesis(Hypothesis):
     """
@@ -331,47 +462,15 @@ class MultiParameterHypothesis(Hypothesis):
         """
         Compute the cost for a multi parameter hypothesis.
         """
-        self._RSS = 0
-        self._rRSS = 0
-        smape = 0
-        re_sum = 0
-
-        for measurement in measurements:
-            coordinate = measurement.coordinate
-            parameter_value_pairs = {}
-            for parameter, value in enumerate(coordinate):
-                parameter_value_pairs[parameter] = float(value)
-
-            predicted = self.function.evaluate(parameter_value_pairs)
-            # print(predicted)
-
-            actual = measurement.value(self._use_measure)
-
-            # print(actual)
-
-            difference = predicted - actual
-            # absolute_difference = abs(difference)
-            abssum = abs(actual) + abs(predicted)
-
-            # calculate relative error
-            absolute_error = abs(predicted - actual)
-            relative_error = absolute_error / actual
-            re_sum = re_sum + relative_error
-
-            self._RSS += difference * difference
-
-            relativeDifference = difference / actual
-            self._rRSS += relativeDifference * relativeDifference
+        # one row per parameter, one column per measurement
+        batch = MeasurementBatch.from_measurements(measurements)
+        points, actual = batch.points, batch.values(self._use_measure)
+        predicted = self.function.evaluate(points)
 
-            if abssum != 0.0:
-                # This `if` condition prevents a division by zero, but it is correct: if sum is 0,
-                # both `actual` and `predicted` must have been 0, and in that case the error at this point is 0,
-                # so we don't need to add anything.
-                smape += abs(difference) / abssum * 2
+        self._RSS, self._rRSS, self._RE, smape_sum, _ = _compute_cost_statistics(predicted, actual)
 
         # times 100 for percentage error
-        self._RE = re_sum / len(measurements)
-        self._SMAPE = smape / len(measurements) * 100
+        self._SMAPE = smape_sum / len(measurements) * 100
         self._costs_are_calculated = True
 
     def compute_adjusted_rsquared(self, TSS, measurements):
@@ -392,24 +491,25 @@ class MultiParameterHypothesis(Hypothesis):
         """
         Computes the coefficients of the function using the least squares solution.
         """
-        # creating a numpy matrix representation of the lgs
-        a_list = []
-
         self.function.reset_coefficients()
 
-        for measurement in measurements:
-            list_element = [1]  # 1 for constant coefficient
-            for multi_parameter_term in self.function:
-                coordinate = measurement.coordinate
-                multi_parameter_term_value = multi_parameter_term.evaluate(coordinate)
-                list_element.append(multi_parameter_term_value)
-            a_list.append(list_element)
-            # print(str(list_element)+"[x]=["+str(value)+"]")
-            # logging.debug(str(list_element)+"[x]=["+str(value)+"]")
+        batch = MeasurementBatch.from_measurements(measurements)
+        points, B = batch.points, batch.values(self._use_measure)
+
+        if len(self.function.compound_terms) == 1:
+            multi_parameter_term = self.function.compound_terms[0]
+            solution = _fit_single_term(multi_parameter_term.evaluate(points), B)
+            if solution is not None:
+                self.function.constant_coefficient, multi_parameter_term.coefficient = solution
+                return
+
+        # creating a numpy matrix representation of the lgs, column 0 for the constant coefficient
+        A = numpy.empty((len(B), len(self.function.compound_terms) + 1), order='F')
+        A[:, 0] = 1
+        for i, multi_parameter_term in enumerate(self.function, start=1):
+            A[:, i] = multi_parameter_term.evaluate(points)
 
         # solving the lgs for coeffs to get the coefficients
-        A = numpy.array(a_list)
-        B = numpy.fromiter(Measurement.select_measure(measurements, self._use_measure), float, len(measurements))
         try:
             coeffs, residuals, rank, sing_val = numpy.linalg.lstsq(A, B, None)
             if rank < A.shape[1]:  # if rcond is to big the rank of A collapses and the coefficients are wrong
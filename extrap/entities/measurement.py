@@ -47,6 +47,24 @@ class Measure(enum.Enum):
         return [m for m in Measure if m != cls.UNKNOWN]
 
 
+def _fast_statistics(values: np.ndarray):
+    """
+    Computes median, mean, minimum, maximum and standard deviation of an unmasked array using a single sort.
+    Returns None if the values contain NaNs, because their handling differs between the statistics.
+    """
+    mean = values.mean()
+    if np.isnan(mean):
+        return None
+    sorted_values = np.sort(values, axis=None)
+    n = sorted_values.size
+    half = n // 2
+    if n % 2:
+        median = sorted_values[half] * 1.0
+    else:
+        median = (sorted_values[half - 1] + sorted_values[half]) / 2.0
+    return median, mean, sorted_values[0], sorted_values[-1], values.std()
+
+
 class Measurement:
     """
     This class represents a measurement, i.e. the value measured for a specific metric and callpath at a coordinate.
@@ -69,11 +87,17 @@ class Measurement:
             self.values: Optional[np.ndarray] = values
         else:
             self.values = None
-        self.median: float = ma.median(values)
-        self.mean: float = ma.mean(values)
-        self.minimum: float = ma.min(values)
-        self.maximum: float = ma.max(values)
-        self.std: float = ma.std(values)
+        statistics = None
+        if type(values) is np.ndarray and values.size > 0:
+            statistics = _fast_statistics(values)
+        if statistics is None:
+            statistics = ma.median(values), ma.mean(values), ma.min(values), ma.max(values), ma.std(values)
+        self.median: float
+        self.mean: float
+        self.minimum: float
+        self.maximum: float
+        self.std: float
+        self.median, self.mean, self.minimum, self.maximum, self.std = statistics
         if repetitions is not None:
             self.repetitions = repetitions
         else:
@@ -241,6 +265,59 @@ class Measurement:
         return self
 
 
+class MeasurementBatch:
+    """
+    Stores the coordinates and the values of a sequence of measurements as read-only arrays.
+    The coordinates are available as points with one row per parameter and one column per measurement.
+    All hypotheses of a model search are fitted to the same measurements, therefore, the modelers create one batch
+    per modeling call and pass it to the hypotheses instead of the measurements.
+    The values are read when they are first requested, later changes of the measurements are not reflected.
+    """
+
+    def __init__(self, measurements: Iterable[Measurement]):
+        self.measurements = tuple(measurements)
+        if self.measurements:
+            coordinates = np.array([m.coordinate.as_tuple() for m in self.measurements], dtype=float)
+        else:
+            coordinates = np.empty((0, 1))
+        coordinates.flags.writeable = False
+        self.coordinates = coordinates
+        self.points = coordinates.T
+        # the same array object is returned every time, so that evaluations of terms can be cached
+        self.first_parameter_points = self.points[0]
+        self._values = {}
+
+    @classmethod
+    def from_measurements(cls, measurements: Union[Sequence[Measurement], MeasurementBatch]) -> MeasurementBatch:
+        if isinstance(measurements, MeasurementBatch):
+            return measurements
+        return cls(measurements)
+
+    @property
+    def dimensions(self):
+        return self.coordinates.shape[1]
+
+    @property
+    def means(self) -> np.ndarray:
+        return self.values(Measure.MEAN)
+
+    @property
+    def medians(self) -> np.ndarray:
+        return self.values(Measure.MEDIAN)
+
+    def values(self, measure: Union[bool, Measure]) -> np.ndarray:
+        values = self._values.get(measure)
+        if values is None:
+            values = np.fromiter(Measurement.select_measure(self.measurements, measure), float,
+                                 len(self.measurements))
+            values.flags.writeable = False
+            self._values[measure] = values
+        return values
+
+    def __len__(self):
+        return len(self.measurements)
+
+
 class MeasurementSchema(Schema):
     coordinate = fields.Nested(CoordinateSchema)
     metric = fields.Nested(MetricSchema)
@@ -40,8 +40,18 @@ class NamedEntity(ABC):
         self.name = name
         self.id = next(type(self).ID_COUNTER)
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
+        # the hash is memoized, because named entities are used as keys in the heavily used measurement dicts
+        self._hash = hash(value)
+
     def __hash__(self):
-        return hash(self.name)
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, type(self)):
@@ -25,6 +25,34 @@ DEFAULT_PARAM_NAMES = (
     'm', 'n', 'o')
 
 
+def _integer_power(value: np.ndarray, exponent: int):
+    """
+    Raises the array to the power of 3 or 4 using multiplications, which is considerably faster than numpy.power.
+    Returns a new array.
+    """
+    result = np.square(value, dtype=float)
+    if exponent == 3:
+        result *= value
+    else:
+        np.square(result, out=result)
+    return result
+
+
+def _square_root_power(value: np.ndarray, exponent: float):
+    """
+    Raises the array to the power of 0.25, 1.5 or 2.5 using square roots and multiplications,
+    which is considerably faster than numpy.power. Returns a new array.
+    """
+    result = np.sqrt(value, dtype=float)
+    if exponent == 0.25:
+        np.sqrt(result, out=result)
+    else:
+        result *= value
+        if exponent == 2.5:
+            result *= value
+    return result
+
+
 class Term(ABC):
 
     def __init__(self):
@@ -51,9 +79,19 @@ class Term(ABC):
 
 class SingleParameterTerm(Term, ABC):
     @abstractmethod
-    def evaluate(self, parameter_value):
+    def evaluate(self, parameter_value, log_value=None):
+        """
+        Evaluates the term for the given parameter value.
+        The logarithm (base 2) of the parameter value can be passed as log_value, if it is already known.
+        """
         raise NotImplementedError
 
+    def multiply_into(self, buffer: np.ndarray, parameter_value, log_value=None):
+        """
+        Multiplies the value of the term for the given parameter values into the buffer in place.
+        """
+        buffer *= self.evaluate(parameter_value, log_value)
+
     def __mul__(self, other):
         return CompoundTerm(self, other)
 
@@ -78,6 +116,9 @@ class SimpleTerm(SingleParameterTerm):
     def exponent(self, value):
         self._exponent = value
         self._float_exponent = float(value)
+        # numpy already handles the exponents 1, 2, and 0.5 efficiently
+        self._integer_exponent = int(value) if self._float_exponent in (3.0, 4.0) else None
+        self._square_root_exponent = self._float_exponent if self._float_exponent in (0.25, 1.5, 2.5) else None
 
     @property
     def term_type(self):
@@ -88,8 +129,10 @@ class SimpleTerm(SingleParameterTerm):
         self._term_type = val
         if self._term_type == "polynomial":
             self.evaluate = self._evaluate_polynomial
+            self.multiply_into = self._multiply_polynomial_into
         elif self._term_type == "logarithm":
             self.evaluate = self._evaluate_logarithm
+            self.multiply_into = self._multiply_logarithm_into
 
     def reset_coefficients(self):
         pass
@@ -108,15 +151,49 @@ class SimpleTerm(SingleParameterTerm):
                 return f"\\log2{{{parameter}}}^{{{self.exponent}}}"
             return f"log2({parameter})^({self.exponent})"
 
-    def _evaluate_polynomial(self, parameter_value):
+    def _evaluate_polynomial(self, parameter_value, log_value=None):
+        if isinstance(parameter_value, np.ndarray):
+            if self._integer_exponent is not None:
+                return _integer_power(parameter_value, self._integer_exponent)
+            elif self._square_root_exponent is not None:
+                return _square_root_power(parameter_value, self._square_root_exponent)
         return parameter_value ** self._float_exponent
 
-    def _evaluate_logarithm(self, parameter_value):
+    def _evaluate_logarithm(self, parameter_value, log_value=None):
+        if self._integer_exponent is not None and isinstance(parameter_value, np.ndarray):
+            return _integer_power(log_value if log_value is not None else np.log2(parameter_value),
+                                  self._integer_exponent)
+        if log_value is not None:
+            return log_value ** self._float_exponent
         log = np.log2(parameter_value)
         log **= self._float_exponent
         return log
 
-    def evaluate(self, parameter_value):
+    def _multiply_polynomial_into(self, buffer, parameter_value, log_value=None):
+        # small exponents are applied as repeated multiplications, which do not need a temporary array
+        if self._float_exponent == 1:
+            buffer *= parameter_value
+        elif self._float_exponent == 2:
+            buffer *= parameter_value
+            buffer *= parameter_value
+        else:
+            buffer *= self._evaluate_polynomial(parameter_value)
+
+    def _multiply_logarithm_into(self, buffer, parameter_value, log_value=None):
+        if self._float_exponent in (1, 2):
+            if log_value is None:
+                log_value = np.log2(parameter_value)
+            buffer *= log_value
+            if self._float_exponent == 2:
+                buffer *= log_value
+        else:
+            buffer *= self._evaluate_logarithm(parameter_value, log_value)
+
+    def evaluate(self, parameter_value, log_value=None):
+        # is dispatched during object creation
+        raise NotImplementedError
+
+    def multiply_into(self, buffer: np.ndarray, parameter_value, log_value=None):
         # is dispatched during object creation
         raise NotImplementedError
 
@@ -131,20 +208,58 @@ class SimpleTerm(SingleParameterTerm):
 
 
 class CompoundTerm(SingleParameterTerm):
+    _EVALUATION_CACHE_SIZE = 8
 
     def __init__(self, *terms):
         super().__init__()
         self.simple_terms: List[SimpleTerm] = list(terms)
+        # maps the ids of read-only parameter arrays to the arrays and the product of the simple terms
+        self._evaluation_cache = {}
 
     def add_simple_term(self, simple_term):
         self.simple_terms.append(simple_term)
-
-    def evaluate(self, parameter_value):
-        function_value = self.coefficient
-        for t in self.simple_terms:
-            function_value *= t.evaluate(parameter_value)
+        self._evaluation_cache.clear()
+
+    def evaluate(self, parameter_value, log_value=None):
+        simple_terms = iter(self.simple_terms)
+        first_term = next(simple_terms, None)
+        if first_term is None:
+            return self.coefficient
+
+        # read-only arrays cannot change, therefore, the product of the simple terms can be reused for them
+        cacheable = (type(parameter_value) is np.ndarray and parameter_value.ndim > 0
+                     and not parameter_value.flags.writeable)
+        if cacheable:
+            entry = self._evaluation_cache.get(id(parameter_value))
+            if entry is not None and entry[0] is parameter_value:
+                function_value = entry[1].copy()
+                function_value *= self.coefficient
+                return function_value
+
+        # the result of the first simple term is a new value, it is reused as buffer for the remaining products
+        function_value = first_term.evaluate(parameter_value, log_value)
+        if isinstance(function_value, np.ndarray):
+            for t in simple_terms:
+                t.multiply_into(function_value, parameter_value, log_value)
+        else:
+            for t in simple_terms:
+                function_value *= t.evaluate(parameter_value, log_value)
+
+        if cacheable:
+            if len(self._evaluation_cache) >= self._EVALUATION_CACHE_SIZE:
+                self._evaluation_cache.clear()
+            product = function_value.copy()
+            product.flags.writeable = False
+            self._evaluation_cache[id(parameter_value)] = parameter_value, product
+        function_value *= self.coefficient
         return function_value
 
+    def has_logarithm(self):
+        """
+        Returns True if the term contains a logarithm, i.e., if its evaluation requires the logarithm of the parameter.
+        """
+        return any(t.term_type == "logarithm" for t in self.simple_terms)
+
     def to_string(self, parameter='p', *, format: FunctionFormats = None):
         term_list = (t.to_string(parameter, format=format) for t in self.simple_terms)
         if self.coefficient != 1 or not self.simple_terms:
@@ -160,6 +275,7 @@ class CompoundTerm(SingleParameterTerm):
 
     def __imul__(self, term: SimpleTerm):
         self.simple_terms.append(term)
+        self._evaluation_cache.clear()
         return self
 
     @staticmethod
@@ -197,7 +313,7 @@ class SegmentedTerm(CompoundTerm):
     def reset_coefficients(self):
         pass
 
-    def evaluate(self, parameter_value):
+    def evaluate(self, parameter_value, log_value=None):
         if not self.segments:
             return super().evaluate(parameter_value)
 
@@ -272,7 +388,14 @@ class MultiParameterTerm(Term):
         for _, t in self.parameter_term_pairs:
             t.reset_coefficients()
 
-    def evaluate(self, parameter_values: Union[Tuple[float], Coordinate]):
+    def evaluate(self, parameter_values: Union[Tuple[float], Coordinate, np.ndarray]):
+        if isinstance(parameter_values, np.ndarray) and parameter_values.ndim == 2:
+            # one row per parameter, the whole batch is multiplied into one buffer
+            function_value = np.full(parameter_values.shape[1], self.coefficient, dtype=float)
+            for param, term in self.parameter_term_pairs:
+                term.multiply_into(function_value, parameter_values[param])
+            return function_value
+
         function_value = self.coefficient
         for param, term in self.parameter_term_pairs:
             parameter_value = parameter_values[param]
@@ -13,6 +13,8 @@ from dataclasses import dataclass, field
 from numbers import Number
 from typing import TYPE_CHECKING, List, Sequence, Tuple
 
+import numpy as np
+
 from extrap.entities.callpath import Callpath
 from extrap.entities.calltree import CallTree
 from extrap.entities.calltree import Node
@@ -33,12 +35,10 @@ def format_callpaths(experiment):
     This method formats the output so that only the callpaths are shown.
     """
     callpaths = experiment.callpaths
-    text = ""
-    for callpath_id in range(len(callpaths)):
-        callpath = callpaths[callpath_id]
-        callpath_string = callpath.name
-        text += callpath_string + "\n"
-    return text
+    text = []
+    for callpath in callpaths:
+        text.append(callpath.name + "\n")
+    return "".join(text)
 
 
 def format_metrics(experiment):
@@ -46,12 +46,10 @@ def format_metrics(experiment):
     This method formats the output so that only the metrics are shown.
     """
     metrics = experiment.metrics
-    text = ""
-    for metric_id in range(len(metrics)):
-        metric = metrics[metric_id]
-        metric_string = metric.name
-        text += metric_string + "\n"
-    return text
+    text = []
+    for metric in metrics:
+        text.append(metric.name + "\n")
+    return "".join(text)
 
 
 def format_parameters(experiment):
@@ -59,12 +57,10 @@ def format_parameters(experiment):
     This method formats the output so that only the parameters are shown.
     """
     parameters = experiment.parameters
-    text = ""
-    for parameters_id in range(len(parameters)):
-        parameter = parameters[parameters_id]
-        parameter_string = parameter.name
-        text += parameter_string + "\n"
-    return text
+    text = []
+    for parameter in parameters:
+        text.append(parameter.name + "\n")
+    return "".join(text)
 
 
 def format_functions(experiment, format: FunctionFormats = None):
@@ -73,20 +69,23 @@ def format_functions(experiment, format: FunctionFormats = None):
     """
     modeler = experiment.modelers[0]
     models = modeler.models
-    text = ""
+    text = []
     for model in models.values():
         if isinstance(model, SegmentedModel):
-            counter = 1
-            for m in model.segment_models:
+            for counter, m in enumerate(model.segment_models, 1):
                 function_string = m.hypothesis.function.to_string(*experiment.parameters, format=format)
-                text += "Model " + str(counter) + ": " + function_string + "\n"
-                counter += 1
+                text.append("Model " + str(counter) + ": " + function_string + "\n")
         else:
             hypothesis = model.hypothesis
             function = hypothesis.function
             function_string = function.to_string(*experiment.parameters, format=format)
-            text += function_string + "\n"
-    return text
+            text.append(function_string + "\n")
+    return "".join(text)
+
+
+_format_measurement_line = "\t\t{} Mean: {:.2E} Median: {:.2E}\n".format
+_format_costs = "\t\tRSS: {:.2E}\n\t\tAdjusted R^2: {:.2E}\n".format
+_format_segment_costs = "\t\tRSS Model {}: {:.2E}\n\t\tAdjusted R^2 Model {}: {:.2E}\n".format
 
 
 def format_all(experiment, format: FunctionFormats = None):
@@ -96,37 +95,34 @@ def format_all(experiment, format: FunctionFormats = None):
     coordinates = experiment.coordinates
     callpaths = experiment.callpaths
     metrics = experiment.metrics
-    modeler = experiment.modelers[0]
-    text = ""
-    for callpath_id in range(len(callpaths)):
-        callpath = callpaths[callpath_id]
+    parameters = experiment.parameters
+    models = experiment.modelers[0].models
+    # the coordinate texts are the same for all callpaths and metrics, so they are formatted only once
+    coordinate_values = np.char.mod('%.2E', np.array([c.as_tuple() for c in coordinates], dtype=float))
+    coordinate_texts = [f"Measurement point: ({','.join(values)})" for values in coordinate_values.tolist()]
+    text = []
+    for callpath in callpaths:
         callpath_string = callpath.name
-        text += "Callpath: " + callpath_string + "\n"
-        for metric_id in range(len(metrics)):
-            metric = metrics[metric_id]
+        text.append("Callpath: " + callpath_string + "\n")
+        for metric in metrics:
             metric_string = metric.name
-            text += "\tMetric: " + metric_string + "\n"
-            for coordinate_id in range(len(coordinates)):
-                coordinate = coordinates[coordinate_id]
-                dimensions = coordinate.dimensions
-                coordinate_text = "Measurement point: ("
-                for dimension in range(dimensions):
-                    value = coordinate[dimension]
-                    value_string = "{:.2E}".format(value)
-                    coordinate_text += value_string + ","
-                coordinate_text = coordinate_text[:-1]
-                coordinate_text += ")"
-                measurement = experiment.get_measurement(coordinate_id, callpath_id, metric_id)
+            text.append("\tMetric: " + metric_string + "\n")
+            measurements = {}
+            for m in experiment.measurements.get((callpath, metric), []):
+                measurements.setdefault(m.coordinate, m)
+            for coordinate, coordinate_text in zip(coordinates, coordinate_texts):
+                measurement = measurements.get(coordinate)
                 if measurement is None:
                     value_mean = 0
                     value_median = 0
                 else:
                     value_mean = measurement.mean
                     value_median = measurement.median
-                text += f"\t\t{coordinate_text} Mean: {value_mean:.2E} Median: {value_median:.2E}\n"
-            model = modeler.models.get((callpath, metric))
+                text.append(_format_measurement_line(coordinate_text, value_mean, value_median))
+            model = models.get((callpath, metric))
+            is_segmented = isinstance(model, SegmentedModel)
             if model is not None:
-                if isinstance(model, SegmentedModel):
+                if is_segmented:
                     hypotheses = []
                     function_strings = []
                     rss_values = []
@@ -134,49 +130,44 @@ def format_all(experiment, format: FunctionFormats = None):
                     for m in model.segment_models:
                         hypotheses.append(m.hypothesis)
                         function_strings.append(
-                            m.hypothesis.function.to_string(*experiment.parameters, format=format))
+                            m.hypothesis.function.to_string(*parameters, format=format))
                         rss_values.append(m.hypothesis.RSS)
                         ar2_values.append(m.hypothesis.AR2)
 
                 else:
                     hypothesis = model.hypothesis
                     function = hypothesis.function
-                    function_string = function.to_string(*experiment.parameters, format=format)
+                    function_string = function.to_string(*parameters, format=format)
                     rss = hypothesis.RSS
                     ar2 = hypothesis.AR2
             else:
                 rss = 0
                 ar2 = 0
                 function_string = "None"
-            if isinstance(model, SegmentedModel):
+            if is_segmented:
                 if len(model.changing_points) == 1:
                     param_value = model.changing_points[0].coordinate[0]
-                    text += "\t\tModel 1: " + function_strings[0] + " for " + str(
-                        experiment.parameters[0]) + "<=" + str(param_value) + "\n"
-                    text += "\t\tModel 2: " + function_strings[1] + " for " + str(
-                        experiment.parameters[0]) + ">=" + str(param_value) + "\n"
-                    text += "\t\tRSS Model 1: {:.2E}\n".format(rss_values[0])
-                    text += "\t\tAdjusted R^2 Model 1: {:.2E}\n".format(ar2_values[0])
-                    text += "\t\tRSS Model 2: {:.2E}\n".format(rss_values[1])
-                    text += "\t\tAdjusted R^2 Model 2: {:.2E}\n".format(ar2_values[1])
+                    text.append("\t\tModel 1: " + function_strings[0] + " for " + str(
+                        parameters[0]) + "<=" + str(param_value) + "\n")
+                    text.append("\t\tModel 2: " + function_strings[1] + " for " + str(
+                        parameters[0]) + ">=" + str(param_value) + "\n")
+                    text.append(_format_segment_costs(1, rss_values[0], 1, ar2_values[0]))
+                    text.append(_format_segment_costs(2, rss_values[1], 2, ar2_values[1]))
                 elif len(model.changing_points) == 2:
                     param_value_1 = model.changing_points[0].coordinate[0]
                     param_value_2 = model.changing_points[1].coordinate[0]
-                    text += "\t\tModel 1: " + function_strings[0] + " for " + str(
-                        experiment.parameters[0]) + "<=" + str(param_value_1) + "\n"
-                    text += "\t\tModel 2: " + function_strings[1] + " for " + str(
-                        experiment.parameters[0]) + ">=" + str(param_value_2) + "\n"
-                    text += "\t\tRSS Model 1: {:.2E}\n".format(rss_values[0])
-                    text += "\t\tAdjusted R^2 Model 1: {:.2E}\n".format(ar2_values[0])
-                    text += "\t\tRSS Model 2: {:.2E}\n".format(rss_values[1])
-                    text += "\t\tAdjusted R^2 Model 2: {:.2E}\n".format(ar2_values[1])
+                    text.append("\t\tModel 1: " + function_strings[0] + " for " + str(
+                        parameters[0]) + "<=" + str(param_value_1) + "\n")
+                    text.append("\t\tModel 2: " + function_strings[1] + " for " + str(
+                        parameters[0]) + ">=" + str(param_value_2) + "\n")
+                    text.append(_format_segment_costs(1, rss_values[0], 1, ar2_values[0]))
+                    text.append(_format_segment_costs(2, rss_values[1], 2, ar2_values[1]))
                 else:
                     raise NotImplementedError
             else:
-                text += "\t\tModel: " + function_string + "\n"
-                text += "\t\tRSS: {:.2E}\n".format(rss)
-                text += "\t\tAdjusted R^2: {:.2E}\n".format(ar2)
-    return text
+                text.append("\t\tModel: " + function_string + "\n")
+                text.append(_format_costs(rss, ar2))
+    return "".join(text)
 
 
 def format_output(experiment, printtype):
@@ -245,16 +236,15 @@ def append_to_repetition_dict(complete_data, key, coordinate, value, progress_ba
 
 def repetition_dict_to_experiment(complete_data, experiment, progress_bar=DUMMY_PROGRESS, keep_values=False):
     progress_bar.step('Creating experiment')
-    for mi, key in enumerate(complete_data):
+    for (callpath, metric), measurementset in complete_data.items():
         progress_bar.update()
-        callpath, metric = key
-        measurementset = complete_data[key]
         experiment.add_callpath(callpath)
         experiment.add_metric(metric)
         for coordinate in measurementset:
-            values = measurementset[coordinate]
             experiment.add_coordinate(coordinate)
-            experiment.add_measurement(Measurement(coordinate, callpath, metric, values, keep_values=keep_values))
+        experiment.extend_measurements(callpath, metric,
+                                       [Measurement(coordinate, callpath, metric, values, keep_values=keep_values)
+                                        for coordinate, values in measurementset.items()])
 
 
 def create_call_tree(callpaths: List[Callpath], progress_bar=DUMMY_PROGRESS, progress_total_added=False,
@@ -268,105 +258,39 @@ def create_call_tree(callpaths: List[Callpath], progress_bar=DUMMY_PROGRESS, pro
     """
     tree = CallTree()
     progress_bar.step('Creating calltree')
-    # create a two-dimensional array of the callpath elements as strings
-    callpaths2 = []
-    max_length = 0
 
     if not progress_total_added:
         progress_bar.total += len(callpaths) * progress_scale
 
-    for splitted_callpath in callpaths:
-        callpath_string = splitted_callpath.name
-        elems = callpath_string.split("->")
-        callpaths2.append(elems)
+    for callpath in callpaths:
+        elems = callpath.name.split("->")
         progress_bar.total += len(elems) * progress_scale
         progress_bar.update(progress_scale)
-        if len(elems) > max_length:
-            max_length = len(elems)
-
-    # iterate over the elements of one call path
-    for i in range(max_length):
-        # iterate over all callpaths
-        for callpath, splitted_callpath in zip(callpaths, callpaths2):
-            # check that we do not try to access an element that does not exist
-            if i >= len(splitted_callpath):
-                continue
-            # if the element does exist
-            progress_bar.update(progress_scale)
-            callpath_string = splitted_callpath[i]
 
-            # when at root level
-            if i == 0:
-                root_node = tree
-            # when not at root level, the previous nodes of the elements have to be checked
-            else:
-                # find the root node of the element that we want to add currently
-                root_node = find_root_node(splitted_callpath, tree, i)
-
-            # check if that child node is already existing
-            child_node = root_node.find_child(callpath_string)
-            is_leaf = i == len(splitted_callpath) - 1
-            if child_node:
-                if is_leaf:
-                    if child_node.path == Callpath.EMPTY:
-                        child_node.path = callpath
-                    else:
-                        warnings.warn("Duplicate callpath encountered, only first occurence is retained.")
+        # walk down the tree along the elements of the callpath and add the missing nodes
+        node = tree
+        for callpath_string in elems[:-1]:
+            progress_bar.update(progress_scale)
+            child_node = node.find_child(callpath_string)
+            if child_node is None:
+                child_node = Node(callpath_string, Callpath.EMPTY)
+                node.add_child_node(child_node)
+            node = child_node
 
-            else:
-                # add a new child node to the root node
-                if is_leaf:
-                    child_node = Node(callpath_string, callpath)
-                else:
-                    child_node = Node(callpath_string, Callpath.EMPTY)
-                root_node.add_child_node(child_node)
+        # the last element is the leaf that represents the callpath
+        progress_bar.update(progress_scale)
+        callpath_string = elems[-1]
+        child_node = node.find_child(callpath_string)
+        if child_node is None:
+            node.add_child_node(Node(callpath_string, callpath))
+        elif child_node.path == Callpath.EMPTY:
+            child_node.path = callpath
+        else:
+            warnings.warn("Duplicate callpath encountered, only first occurence is retained.")
 
     return tree
 
 
-def find_root_node(callpath_elements, tree, loop_id):
-    """
-    This method finds the root node of an element in the callpath tree.
-    Therefore, it searches iteratively through the tree.
-    """
-    level = 0
-    root_element_string = callpath_elements[level]
-    root_node = tree.get_node(root_element_string)
-
-    # root node already found
-    if loop_id == level + 1:
-        return root_node
-
-    # need to search deeper in the tree for the root node
-    else:
-        return find_child_node(root_node, level, callpath_elements, loop_id)
-
-
-def find_child_node(root_node, level, callpath_elements, loop_id):
-    """
-    This method searches for a child node in the tree. Searches iteratively
-    into the three and each nodes child nodes. Returns the root node of the
-    child.
-    """
-    level = level + 1
-    root_element_string = callpath_elements[level]
-    childs = root_node.childs
-
-    for i in range(len(childs)):
-        child_name = childs[i].name
-
-        if child_name == root_element_string:
-            new_root_node = childs[i]
-
-            # root node already found
-            if loop_id == level + 1:
-                return new_root_node
-
-            # need to search deeper in the tree for the root node
-            else:
-                return find_child_node(new_root_node, level, callpath_elements, loop_id)
-
-
 def validate_experiment(experiment: Experiment, progress_bar=DUMMY_PROGRESS):
     def require(cond, message):
         if not cond:
@@ -425,25 +349,26 @@ def check_for_strong_scaling(experiment: Experiment, progress_bar=DUMMY_PROGRESS
         measurement_agg = metric_measurement_agg[metric]
 
         if not measurement_agg.dimension_coordinates:
-            dimension_groups = [
-                {} for _ in range(dimensions)
-            ]
-            # group all measurements for each dimension, by their coordinates in the other dimensions
-            for m in experiment.measurements[main_node.path, metric]:
-                for p in range(dimensions):
-                    coordinate_p_ = m.coordinate.as_partial_tuple(p)
-                    groups_p_ = dimension_groups[p]
-                    if coordinate_p_ in groups_p_:
-                        groups_p_[coordinate_p_].append(m)
-                    else:
-                        groups_p_[coordinate_p_] = [m]
-
-            for d, dimension_group in enumerate(dimension_groups):
-                longest_group = max(dimension_group.values(), key=lambda x: (len(x), sum(e.mean for e in x)))
+            main_measurements = experiment.measurements[main_node.path, metric]
+            coordinates = np.array([m.coordinate.as_tuple() for m in main_measurements], dtype=float)
+            means = np.array([m.mean for m in main_measurements], dtype=float)
+
+            for d in range(dimensions):
+                # group all measurements by their coordinates in the other dimensions
+                _, first_index, group_ids = np.unique(np.delete(coordinates, d, axis=1), axis=0,
+                                                      return_index=True, return_inverse=True)
+                group_ids = group_ids.reshape(-1)
+                group_lengths = np.bincount(group_ids)
+                group_sums = np.bincount(group_ids, weights=means)
+                # select the longest group, then the group with the largest sum,
+                # then the group that occurs first in the measurements
+                longest_group = np.lexsort((first_index, -group_sums, -group_lengths))[0]
+
                 dimension_coordinates = []
-                for m in longest_group:
-                    dimension_coordinates.append(m.coordinate)
-                    measurement_agg.measurements[m.coordinate] = 0
+                for i in np.flatnonzero(group_ids == longest_group):
+                    coordinate = main_measurements[i].coordinate
+                    dimension_coordinates.append(coordinate)
+                    measurement_agg.measurements[coordinate] = 0
                 dimension_coordinates.sort(key=lambda c: c[d])
                 assert len(measurement_agg.dimension_coordinates) == d
                 measurement_agg.dimension_coordinates.append(dimension_coordinates)
@@ -458,16 +383,9 @@ def check_for_strong_scaling(experiment: Experiment, progress_bar=DUMMY_PROGRESS
         for d, coords in enumerate(check_data.dimension_coordinates):
             if len(coords) <= 1:
                 continue
-            is_strong_scaling = True
-            prev_mean = check_data.measurements[coords[0]]
-            for c in coords[1:]:
-                if prev_mean <= check_data.measurements[c]:
-                    is_strong_scaling = False
-                    break
-                else:
-                    prev_mean = check_data.measurements[c]
-
-            if is_strong_scaling:
+            values = np.array([check_data.measurements[c] for c in coords], dtype=float)
+            # strong scaling requires strictly decreasing values
+            if not np.any(values[:-1] <= values[1:]):
                 results[d] += 1
 
     return results
@@ -476,22 +394,29 @@ def check_for_strong_scaling(experiment: Experiment, progress_bar=DUMMY_PROGRESS
 def _aggregate_values_for_strong_scaling_check(agg: dict[Metric, _StrongScalingCheckData], node: Node,
                                                measurements: dict[Tuple[Callpath, Metric], Sequence[Measurement]],
                                                progress_bar=DUMMY_PROGRESS):
-    callpath = node.path if node.path else Callpath.EMPTY
+    agg_items = agg.items()
+    get_measurements = measurements.get
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        callpath = node.path if node.path else Callpath.EMPTY
+
+        if _is_excluded_from_aggregation(callpath):
+            continue
 
-    if callpath.lookup_tag('agg__usage_disabled', False):
-        return
-    if callpath.lookup_tag('agg__disabled', False):
-        return
-    if callpath.lookup_tag('agg__category') is not None:
-        return
+        for metric, measurement_agg in agg_items:
+            metric_measurements = get_measurements((callpath, metric))
+            if metric_measurements is None:
+                continue
+            for m in metric_measurements:
+                if m.coordinate in measurement_agg.measurements:
+                    measurement_agg.measurements[m.coordinate] += m.mean
+
+        # children are pushed in reverse, so that they are visited in the same order as by a recursive traversal
+        stack.extend(reversed(node.childs))
 
-    for metric in agg:
-        if (callpath, metric) not in measurements:
-            continue
-        measurement_agg = agg[metric]
-        for m in measurements[callpath, metric]:
-            if m.coordinate in measurement_agg.measurements:
-                measurement_agg.measurements[m.coordinate] += m.mean
 
-    for child in node:
-        _aggregate_values_for_strong_scaling_check(agg, child, measurements, progress_bar)
+def _is_excluded_from_aggregation(callpath: Callpath):
+    return (callpath.lookup_tag('agg__usage_disabled', False) or
+            callpath.lookup_tag('agg__disabled', False) or
+            callpath.lookup_tag('agg__category') is not None)
@@ -5,6 +5,8 @@
 # This software may be modified and distributed under the terms of a BSD-style license.
 # See the LICENSE file in the base directory for details.
 
+import dataclasses
+
 from PySide6.QtWidgets import *  # @UnusedWildImport
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
@@ -31,6 +33,7 @@ class AdvancedPlotWidget(AbstractPlotWidget):
         self.graphDisplayWindowClass = graphDisplayWindowClass
         self.graphDisplayWindow = None
         self.toolbar = None
+        self._last_draw_state = None
 
     def initUI(self):
         self.setLayout(self.grid)
@@ -87,8 +90,35 @@ class AdvancedPlotWidget(AbstractPlotWidget):
             self.toolbar = MyCustomToolbar(self.graphDisplayWindow, self)
             self.grid.addWidget(self.graphDisplayWindow)
             self.grid.addWidget(self.toolbar)
+        elif self._is_last_draw_state(self._get_draw_state()):
+            return
         else:
             self.graphDisplayWindow.redraw()
+        # the state is taken after drawing, because drawing assigns the colors of new call paths
+        self._last_draw_state = self._get_draw_state()
+
+    def _get_draw_state(self):
+        """
+            This function collects everything the graph depends on, the graph is only redrawn if it changes.
+        """
+        model_list, selected_callpaths = self.main_widget.get_selected_models()
+        data_display = self.main_widget.data_display
+        # the selected objects are kept, so that their ids cannot be reused by other objects
+        selection = (self.main_widget.get_selected_metric(), *(model_list or ()), *(selected_callpaths or ()))
+        settings = (self.max_x, self.max_y, data_display.getValues(),
+                    data_display.getAxisParameter(0).id, data_display.getAxisParameter(1).id,
+                    dataclasses.replace(self.main_widget.plot_formatting_options),
+                    tuple(self.main_widget.model_color_map.items()))
+        return selection, settings
+
+    def _is_last_draw_state(self, draw_state):
+        if self._last_draw_state is None:
+            return False
+        last_selection, last_settings = self._last_draw_state
+        selection, settings = draw_state
+        return (len(last_selection) == len(selection) and
+                all(last is current for last, current in zip(last_selection, selection)) and
+                last_settings == settings)
 
     @staticmethod
     def getNumAxis():
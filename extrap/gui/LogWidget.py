@@ -12,16 +12,42 @@ from PySide6.QtGui import QPaintEvent
 from PySide6.QtWidgets import QWidget, QGridLayout, QTextEdit
 
 
+def _add_log_handler(stream):
+    handler = logging.StreamHandler(stream)
+    handler.terminator = ' '
+    handler.setLevel(logging.INFO)
+    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    logging.getLogger().addHandler(handler)
+    return handler
+
+
+class LogBuffer:
+    """
+    Collects the log output until the log widget is created, so that the widget can be created when it is shown.
+    """
+
+    def __init__(self):
+        self.texts = []
+        self._handler = _add_log_handler(self)
+
+    def write(self, text):
+        self.texts.append(text)
+
+    def create_widget(self, parent):
+        logging.getLogger().removeHandler(self._handler)
+        widget = LogWidget(parent)
+        for text in self.texts:
+            widget.write(text)
+        self.texts.clear()
+        return widget
+
+
 class LogWidget(QWidget):
     def __init__(self, parent):
         super(LogWidget, self).__init__(parent)
         self.log_box = QTextEdit(self)
         self.initUI()
-        handler = logging.StreamHandler(self)
-        handler.terminator = ' '
-        handler.setLevel(logging.INFO)
-        handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
-        logging.getLogger().addHandler(handler)
+        _add_log_handler(self)
 
     def initUI(self):
         layout = QGridLayout(self)
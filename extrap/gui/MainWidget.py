@@ -5,19 +5,24 @@
 # This software may be modified and distributed under the terms of a BSD-style license.
 # See the LICENSE file in the base directory for details.
 
+import dataclasses
 import itertools
 import logging
+import os
 import signal
+import socket
 import sys
 from enum import Enum
-from functools import partial
+from functools import partial, lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional, Sequence, Tuple, Type
 from urllib.error import URLError, HTTPError
 
-from PySide6.QtCore import *  # @UnusedWildImport
-from PySide6.QtGui import *  # @UnusedWildImport
-from PySide6.QtWidgets import *  # @UnusedWildImport
+from PySide6.QtCore import QCoreApplication, QEvent, QSettings, QSocketNotifier, QThreadPool, QUrl, Qt, Slot
+from PySide6.QtGui import QAction, QDesktopServices, QImageWriter, QKeySequence
+from PySide6.QtWidgets import QCheckBox, QDialog, QDialogButtonBox, QDockWidget, QFileDialog, QGridLayout, QLabel, \
+    QMainWindow, QMessageBox, QSpacerItem, QStyle, QWidget
 
 import extrap
 from extrap.entities.calltree import Node
@@ -33,7 +38,7 @@ from extrap.fileio.file_reader.cube_file_reader2 import CubeFileReader2
 from extrap.gui.ColorWidget import ColorWidget
 from extrap.gui.DataDisplay import DataDisplayManager, GraphLimitsWidget
 from extrap.gui.ImportOptionsDialog import ImportOptionsDialog
-from extrap.gui.LogWidget import LogWidget
+from extrap.gui.LogWidget import LogBuffer
 from extrap.gui.MeasurementWizardWidget import MeasurementWizardWidget
 from extrap.gui.ModelerWidget import ModelerWidget
 from extrap.gui.PlotTypeSelector import PlotTypeSelector
@@ -43,14 +48,72 @@ from extrap.gui.components import file_dialog
 from extrap.gui.components.ProgressWindow import ProgressWindow
 from extrap.gui.components.model_color_map import ModelColorMap
 from extrap.gui.components.plot_formatting_options import PlotFormattingOptions, PlotFormattingDialog
+from extrap.gui.components.worker import run_in_background, Worker
 from extrap.modelers.model_generator import ModelGenerator
 from extrap.util.deprecation import deprecated
 from extrap.util.dynamic_options import DynamicOptions
 
+if sys.platform.startswith('darwin'):
+    try:
+        import objc
+        from AppKit import NSColor, NSColorSpace
+    except ImportError:
+        objc = None
+else:
+    objc = None
+
 _SETTING_CHECK_FOR_UPDATES_ON_STARTUP = 'check_for_updates_on_startup'
 
 DEFAULT_MODEL_NAME = "Default Model"
 
+_KS_SCREENSHOT = QKeySequence("Ctrl+I")
+_KS_DELETE_MODEL = QKeySequence("Ctrl+D")
+_KS_RENAME_MODEL = QKeySequence("Ctrl+R")
+
+_SCREENSHOT_DEFAULT_FILTER = "PNG image (*.png)"
+
+
+@lru_cache(maxsize=1)
+def _file_import_specs():
+    return tuple((reader_class, reader_class.GUI_ACTION, reader_class.DESCRIPTION)
+                 for reader_class in all_readers.values())
+
+
+_READ_AHEAD_FILES = 2
+_READ_AHEAD_SIZE = 1 << 20
+
+
+def _read_ahead(paths):
+    """Warms the page cache for the given files, so that opening them later is faster."""
+    for path in paths:
+        try:
+            with open(path, 'rb') as file:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    file.read(_READ_AHEAD_SIZE)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=1)
+def _restore_sigint_handler(reader, writer, previous_handler, previous_wakeup_fd):
+    if writer.fileno() == -1:
+        return
+    current_wakeup_fd = signal.set_wakeup_fd(previous_wakeup_fd)
+    if current_wakeup_fd == writer.fileno():
+        signal.signal(signal.SIGINT, previous_handler)
+    else:
+        # keep the handler that was installed after this one
+        signal.set_wakeup_fd(current_wakeup_fd)
+    reader.close()
+    writer.close()
+
+
+def _screenshot_file_filter():
+    formats = (bytes(f).decode('ascii') for f in QImageWriter.supportedImageFormats())
+    return ';;'.join(f"{fmt.upper()} image (*.{fmt})" for fmt in formats if fmt not in ('icns', 'cur', 'ico'))
+
 
 class CallPathEnum(Enum):
     constant = "constant"
@@ -60,6 +123,25 @@ class CallPathEnum(Enum):
 
 
 class MainWidget(QMainWindow):
+    # name, text, shortcut, status tip, handler, enabled
+    _ACTIONS = [
+        ('screenshot', 'S&creenshot', _KS_SCREENSHOT, 'Creates a screenshot of the Extra-P GUI', 'screenshot', True),
+        ('exit', 'E&xit', QKeySequence.StandardKey.Quit, 'Exit application', 'close', True),
+        ('open_experiment', '&Open experiment', QKeySequence.StandardKey.Open, 'Opens experiment file',
+         'open_experiment', True),
+        ('save_experiment', '&Save experiment', QKeySequence.StandardKey.Save, 'Saves experiment file',
+         'save_experiment', False),
+        ('change_font', 'Plot &formatting options', None, 'Change the formatting of the plots',
+         'open_plot_format_dialog_box', True),
+        ('select_view', 'Select plot &type', None, 'Select the plots you want to view',
+         'open_select_plots_dialog_box', True),
+        ('model_delete', '&Delete model', _KS_DELETE_MODEL, 'Delete the current model', 'selector_widget.model_delete',
+         True),
+        ('model_rename', '&Rename model', _KS_RENAME_MODEL, 'Rename the current model', 'selector_widget.model_rename',
+         True),
+        ('metric_delete', 'Dele&te metrics', None, None, 'selector_widget.delete_metric', True),
+        ('about', '&About', None, None, 'show_about_dialog', True),
+    ]
 
     def __init__(self, *args, **kwargs):
         """
@@ -67,17 +149,22 @@ class MainWidget(QMainWindow):
         """
         super(MainWidget, self).__init__(*args, **kwargs)
 
+        self._ns_window = None
+        self._ns_window_state = None
         self.settings = QSettings(QSettings.Scope.UserScope, "Extra-P", "Extra-P GUI")
 
         self.max_value = 0
         self.min_value = 0
+        self._min_max_version = None
         self.old_x_pos = 0
         self._experiment = None
         self.model_color_map = ModelColorMap()
         self.plot_formatting_options = PlotFormattingOptions()
         self.experiment_change = True
+        self._last_selection = None
+        self._opened_file_path: Optional[Path] = None
         self._init_ui()
-        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        self._install_sigint_handler()
 
         # switch for selecting measure of measurement values for modeling
         # is used when loading the data from a file and then modeling directly
@@ -136,47 +223,20 @@ class MainWidget(QMainWindow):
         self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, dock, Qt.Orientation.Horizontal)
 
         dock2 = QDockWidget("Log", self)
-        self.log_widget = LogWidget(self)
-        dock2.setWidget(self.log_widget)
+        # the log widget is created when the hidden dock is shown for the first time
+        self.log_widget = None
+        self._log_buffer = LogBuffer()
+        self._log_dock = dock2
+        dock2.setWidget(QWidget(dock2))
+        dock2.visibilityChanged.connect(self._on_log_dock_visibility_changed)
         self.tabifyDockWidget(dock, dock2)
         dock2.hide()
         # Menu creation
-
-        # File menu
-        screenshot_action = QAction('S&creenshot', self)
-        screenshot_action.setShortcut('Ctrl+I')
-        screenshot_action.setStatusTip('Creates a screenshot of the Extra-P GUI')
-        screenshot_action.triggered.connect(self.screenshot)
-
-        exit_action = QAction('E&xit', self)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.setStatusTip('Exit application')
-        exit_action.triggered.connect(self.close)
-
-        file_imports = []
-        for reader in all_readers.values():
-            file_imports.append((reader.GUI_ACTION, reader.DESCRIPTION, self._make_import_func(reader)))
-
-        open_experiment_action = QAction('&Open experiment', self)
-        open_experiment_action.setStatusTip('Opens experiment file')
-        open_experiment_action.setShortcut(QKeySequence.StandardKey.Open)
-        open_experiment_action.triggered.connect(self.open_experiment)
-
-        save_experiment_action = QAction('&Save experiment', self)
-        save_experiment_action.setStatusTip('Saves experiment file')
-        save_experiment_action.setShortcut(QKeySequence.StandardKey.Save)
-        save_experiment_action.triggered.connect(self.save_experiment)
-        save_experiment_action.setEnabled(False)
-        self.save_experiment_action = save_experiment_action
-
-        # View menu
-        change_font_action = QAction('Plot &formatting options', self)
-        change_font_action.setStatusTip('Change the formatting of the plots')
-        change_font_action.triggered.connect(self.open_plot_format_dialog_box)
-
-        select_view_action = QAction('Select plot &type', self)
-        select_view_action.setStatusTip('Select the plots you want to view')
-        select_view_action.triggered.connect(self.open_select_plots_dialog_box)
+        actions = {}
+        make_action = self._make_action
+        for name, text, shortcut, status_tip, handler, enabled in self._ACTIONS:
+            actions[name] = make_action(text, shortcut, status_tip, attrgetter(handler)(self), enabled)
+        self.save_experiment_action = actions['save_experiment']
 
         # Plots menu
         graphs = ['&Line graph', 'Selected models in same &surface plot', 'Selected models in &different surface plots',
@@ -186,22 +246,7 @@ class MainWidget(QMainWindow):
                   '&Measurement points']
         graph_actions = [QAction(g, self) for g in graphs]
         for i, g in enumerate(graph_actions):
-            slot = (lambda k: lambda: self.data_display.reloadTabs((k,)))(i)
-            g.triggered.connect(slot)
-
-        # Model menu
-        model_delete_action = QAction('&Delete model', self)
-        model_delete_action.setShortcut('Ctrl+D')
-        model_delete_action.setStatusTip('Delete the current model')
-        model_delete_action.triggered.connect(self.selector_widget.model_delete)
-
-        model_rename_action = QAction('&Rename model', self)
-        model_rename_action.setShortcut('Ctrl+R')
-        model_rename_action.setStatusTip('Rename the current model')
-        model_rename_action.triggered.connect(self.selector_widget.model_rename)
-
-        metric_delete_action = QAction('Dele&te metrics', self)
-        metric_delete_action.triggered.connect(self.selector_widget.delete_metric)
+            g.triggered.connect(partial(self._reload_tab, i))
 
         # Filter menu
         # filter_callpath_action = QAction('Filter Callpaths', self)
@@ -214,22 +259,19 @@ class MainWidget(QMainWindow):
         menubar.setNativeMenuBar(True)
 
         file_menu = menubar.addMenu('&File')
-        for name, tooltip, command in file_imports:
-            action = QAction(name, self)
-            action.setStatusTip(tooltip)
-            action.triggered.connect(command)
-            file_menu.addAction(action)
+        for reader_class, name, tooltip in _file_import_specs():
+            file_menu.addAction(make_action(name, None, tooltip, self._make_import_func(reader_class), True))
         file_menu.addSeparator()
-        file_menu.addAction(open_experiment_action)
-        file_menu.addAction(save_experiment_action)
+        file_menu.addAction(actions['open_experiment'])
+        file_menu.addAction(actions['save_experiment'])
         file_menu.addSeparator()
-        file_menu.addAction(screenshot_action)
+        file_menu.addAction(actions['screenshot'])
         file_menu.addSeparator()
-        file_menu.addAction(exit_action)
+        file_menu.addAction(actions['exit'])
 
         view_menu = menubar.addMenu('&View')
-        view_menu.addAction(change_font_action)
-        view_menu.addAction(select_view_action)
+        view_menu.addAction(actions['change_font'])
+        view_menu.addAction(actions['select_view'])
         ui_parts_menu = self.createPopupMenu()
         if ui_parts_menu:
             ui_parts_menu_action = view_menu.addMenu(ui_parts_menu)
@@ -240,10 +282,10 @@ class MainWidget(QMainWindow):
             plots_menu.addAction(g)
 
         model_menu = menubar.addMenu('&Model')
-        model_menu.addAction(model_delete_action)
-        model_menu.addAction(model_rename_action)
+        model_menu.addAction(actions['model_delete'])
+        model_menu.addAction(actions['model_rename'])
         model_menu.addSeparator()
-        model_menu.addAction(metric_delete_action)
+        model_menu.addAction(actions['metric_delete'])
 
         # filter_menu = menubar.addMenu('Filter')
         # filter_menu.addAction(filter_callpath_action)
@@ -255,9 +297,7 @@ class MainWidget(QMainWindow):
         doc_action.triggered.connect(lambda: QDesktopServices.openUrl(QUrl(extrap.__documentation_link__)))
         help_menu.addAction(doc_action)
 
-        about_action = QAction('&About', self)
-        about_action.triggered.connect(self.show_about_dialog)
-        help_menu.addAction(about_action)
+        help_menu.addAction(actions['about'])
 
         if self.settings.value(_SETTING_CHECK_FOR_UPDATES_ON_STARTUP, True, bool):
             update_available = None
@@ -292,6 +332,57 @@ class MainWidget(QMainWindow):
         self.experiment_change = False
         self.show()
 
+    def _make_action(self, text, shortcut, status_tip, handler, enabled):
+        action = QAction(text, self)
+        if shortcut is not None:
+            action.setShortcut(shortcut)
+        if status_tip is not None:
+            action.setStatusTip(status_tip)
+        action.triggered.connect(handler)
+        action.setEnabled(enabled)
+        return action
+
+    def _install_sigint_handler(self):
+        """
+        Quits the application on SIGINT. The signal is delivered through a wakeup socket, so that the event loop is
+        notified even if the interpreter does not get control.
+        The previous handler and wakeup fd are restored when the window is closed or destroyed.
+        """
+        self._sigint_state = None
+        reader, writer = socket.socketpair()
+        reader.setblocking(False)
+        writer.setblocking(False)
+        try:
+            previous_wakeup_fd = signal.set_wakeup_fd(writer.fileno())
+        except ValueError:
+            # wakeup fds can only be set in the main thread
+            reader.close()
+            writer.close()
+            return
+        previous_handler = signal.signal(signal.SIGINT, lambda signum, frame: None)
+        self._sigint_state = reader, writer, previous_handler, previous_wakeup_fd
+        self._sigint_notifier = QSocketNotifier(reader.fileno(), QSocketNotifier.Type.Read, self)
+        self._sigint_notifier.activated.connect(self._on_sigint)
+        self.destroyed.connect(partial(_restore_sigint_handler, *self._sigint_state))
+
+    def _uninstall_sigint_handler(self):
+        if self._sigint_state is None:
+            return
+        self._sigint_notifier.setEnabled(False)
+        _restore_sigint_handler(*self._sigint_state)
+        self._sigint_state = None
+
+    @Slot()
+    def _on_sigint(self):
+        try:
+            received = self._sigint_state[0].recv(64)
+        except BlockingIOError:
+            return
+        if signal.SIGINT in received:
+            self._uninstall_sigint_handler()
+            # unlike quit, exit does not close the windows, which would ask for confirmation
+            QCoreApplication.exit(0)
+
     def set_experiment(self, experiment, file_name="", *, compared=False):
         if experiment is None:
             raise ValueError("Experiment cannot be none.")
@@ -304,22 +395,59 @@ class MainWidget(QMainWindow):
         self.modeler_widget.experimentChanged()
         self.measurementWizard_widget.experimentChanged()
         self.experiment_change = False
+        self._last_selection = None
         self.updateMinMaxValue()
         self.update()
+        if file_name:
+            self._schedule_read_ahead(file_name)
 
+    def _schedule_read_ahead(self, file_name):
+        path = Path(file_name)
+        if path.suffix != '.extra-p' or not path.is_file():
+            return
+        try:
+            siblings = sorted(path.parent.glob('*.extra-p'))
+            index = siblings.index(path)
+        except (OSError, ValueError):
+            return
+        next_files = siblings[index + 1:index + 1 + _READ_AHEAD_FILES]
+        if next_files:
+            QThreadPool.globalInstance().start(Worker(_read_ahead, next_files))
+
+    @Slot()
     def on_selection_changed(self):
         if not self.experiment_change:
+            # the selected objects are kept, so that their ids cannot be reused by other objects
+            selection = (self.get_current_model_gen(), self.get_selected_metric(),
+                         *self.get_selected_call_tree_nodes())
+            last_selection = self._last_selection
+            if last_selection is not None and len(last_selection) == len(selection) and all(
+                    last is current for last, current in zip(last_selection, selection)):
+                return
+            self._last_selection = selection
             self.data_display.updateWidget()
             self.update()
             self.updateMinMaxValue()
 
+    @Slot(int)
+    def _reload_tab(self, index):
+        self.data_display.reloadTabs((index,))
+
+    @Slot(bool)
+    def _on_log_dock_visibility_changed(self, visible):
+        if visible and self.log_widget is None:
+            self.log_widget = self._log_buffer.create_widget(self._log_dock)
+            self._log_dock.setWidget(self.log_widget)
+            self._log_dock.visibilityChanged.disconnect(self._on_log_dock_visibility_changed)
+
     def keyPressEvent(self, e):
         if e.key() == Qt.Key.Key_Escape:
             self.close()
 
     def closeEvent(self, event):
-        if not self.windowFilePath():
+        if self._opened_file_path is None:
             event.accept()
+            self._uninstall_sigint_handler()
             return
         msg_box = QMessageBox(QMessageBox.Icon.Question, 'Quit', "Are you sure to quit?",
                               QMessageBox.StandardButton.No | QMessageBox.StandardButton.Yes, self, Qt.WindowType.Sheet)
@@ -327,6 +455,7 @@ class MainWidget(QMainWindow):
 
         if msg_box.exec() == QMessageBox.StandardButton.Yes:
             event.accept()
+            self._uninstall_sigint_handler()
         else:
             event.ignore()
 
@@ -345,12 +474,18 @@ class MainWidget(QMainWindow):
     def get_selected_models(self) -> Tuple[Optional[Sequence[Model]], Optional[Sequence[Node]]]:
         return self.selector_widget.get_selected_models()
 
+    @Slot()
     def open_plot_format_dialog_box(self):
+        old_options = dataclasses.replace(self.plot_formatting_options)
+        old_colormap = self.model_color_map.name
         dialog = PlotFormattingDialog(self.plot_formatting_options, self, Qt.WindowType.Sheet, self.model_color_map)
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            if old_options == self.plot_formatting_options and old_colormap == self.model_color_map.name:
+                return
             self.data_display.updateWidget()
             self.update()
 
+    @Slot()
     def open_select_plots_dialog_box(self):
         dialog = PlotTypeSelector(self, self.data_display)
         dialog.setModal(True)
@@ -367,6 +502,7 @@ class MainWidget(QMainWindow):
     def getFontSize(self):
         return self.plot_formatting_options.font_size
 
+    @Slot()
     def screenshot(self, _checked=False, target=None, name_addition=""):
         """
         This function creates a screenshot of this or the target widget
@@ -376,18 +512,14 @@ class MainWidget(QMainWindow):
         if not target:
             target = self
         pixmap = target.grab()
-        image = pixmap.toImage()
 
         def _save(file_name):
             with ProgressWindow(self, "Saving Screenshot"):
-                image.save(file_name)
+                pixmap.save(file_name)
 
-        initial_path = Path(self.windowFilePath()).stem + name_addition
-        file_filter = ';;'.join(
-            [f"{str(f, 'utf-8').upper()} image (*.{str(f, 'utf-8')})" for f in QImageWriter.supportedImageFormats() if
-             str(f, 'utf-8') not in ['icns', 'cur', 'ico']])
-        dialog = file_dialog.showSave(self, _save, "Save Screenshot", initial_path, file_filter)
-        dialog.selectNameFilter("PNG image (*.png)")
+        initial_path = (self._opened_file_path.stem if self._opened_file_path else "") + name_addition
+        dialog = file_dialog.showSave(self, _save, "Save Screenshot", initial_path, _screenshot_file_filter())
+        dialog.selectNameFilter(_SCREENSHOT_DEFAULT_FILTER)
 
     def model_experiment(self, experiment, file_name=""):
         # initialize model generator
@@ -421,9 +553,13 @@ class MainWidget(QMainWindow):
             return _import_function
 
         else:
-            reader: FileReader = reader_class()
-            return partial(self.import_file, reader.read_experiment, title, filter=reader_class.FILTER,
-                           model=reader_class.GENERATE_MODELS_AFTER_LOAD, file_mode=file_mode, reader=reader)
+            def _import_function():
+                # the reader is only created when the import is triggered
+                reader: FileReader = reader_class()
+                self.import_file(reader.read_experiment, title, filter=reader_class.FILTER,
+                                 model=reader_class.GENERATE_MODELS_AFTER_LOAD, file_mode=file_mode, reader=reader)
+
+            return _import_function
 
     def _check_and_convert_scaling(self, experiment, path, reader=None):
         check_res = io_helper.check_for_strong_scaling(experiment)
@@ -452,7 +588,7 @@ class MainWidget(QMainWindow):
                     file_name=None, file_mode=None, reader=None):
         def _import_file(file_name):
             with ProgressWindow(self, progress_text) as pw:
-                experiment = reader_func(file_name, pw)
+                experiment = run_in_background(reader_func, file_name, pw)
                 # call the modeler and create a function model
                 if model:
                     experiment = self._check_and_convert_scaling(experiment, file_name, reader)
@@ -467,12 +603,16 @@ class MainWidget(QMainWindow):
 
     def _set_opened_file_name(self, file_name, *, compared=False):
         if file_name:
+            path = Path(file_name)
+            self._opened_file_path = path if not compared else None
             self.setWindowFilePath(file_name if not compared else "")
-            self.setWindowTitle(Path(file_name).name + " – " + extrap.__title__)
+            self.setWindowTitle(path.name + " – " + extrap.__title__)
         else:
+            self._opened_file_path = None
             self.setWindowFilePath("")
             self.setWindowTitle(extrap.__title__)
 
+    @Slot()
     def open_experiment(self, file_name=None):
         self.import_file(read_experiment, 'Open Experiment',
                          filter='Experiments (*.extra-p)',
@@ -480,10 +620,11 @@ class MainWidget(QMainWindow):
                          progress_text="Loading experiment",
                          file_name=file_name)
 
+    @Slot()
     def save_experiment(self):
         def _save(file_name):
             with ProgressWindow(self, "Saving Experiment") as pw:
-                write_experiment(self.getExperiment(), file_name, pw)
+                run_in_background(write_experiment, self.getExperiment(), file_name, pw)
                 self._set_opened_file_name(file_name)
 
         file_dialog.showSave(self, _save, 'Save Experiment', filter='Experiments (*.extra-p)')
@@ -494,8 +635,12 @@ class MainWidget(QMainWindow):
 
     def updateMinMaxValue(self):
         if not self.experiment_change:
-            self.color_widget.update_min_max(*self.selector_widget.update_min_max_value())
+            min_max_value = self.selector_widget.update_min_max_value()
+            if self.selector_widget.min_max_version != self._min_max_version:
+                self._min_max_version = self.selector_widget.min_max_version
+                self.color_widget.update_min_max(*min_max_value)
 
+    @Slot()
     def show_about_dialog(self):
         about_dialog = QDialog(self)
         about_dialog.setWindowTitle("About " + extrap.__title__)
@@ -589,20 +734,24 @@ class MainWidget(QMainWindow):
         return super().event(e)
 
     def _macos_update_title_bar(self):
-        try:
-            import objc
-            from AppKit import NSWindow, NSView, NSColor, NSColorSpace
-            ns_view = objc.objc_object(c_void_p=int(self.winId()))
+        if objc is None:
+            return
+        win_id = int(self.winId())
+        c = self.palette().window().color()
+        state = (win_id, c.rgba())
+        if state == self._ns_window_state:
+            return
+        if self._ns_window is None or win_id != self._ns_window_state[0]:
+            ns_view = objc.objc_object(c_void_p=win_id)
             ns_window = ns_view.window()
-            if ns_window is not None:
-                ns_window.setTitlebarAppearsTransparent_(True)
-                ns_window.setColorSpace_(NSColorSpace.sRGBColorSpace())
-                c = self.palette().window().color()
-                ns_window_color = NSColor.colorWithDeviceRed_green_blue_alpha_(c.redF(), c.greenF(), c.blueF(),
-                                                                               c.alphaF())
-                ns_window.setBackgroundColor_(ns_window_color)
-        except ImportError:
-            pass
+            if ns_window is None:
+                return
+            ns_window.setTitlebarAppearsTransparent_(True)
+            ns_window.setColorSpace_(NSColorSpace.sRGBColorSpace())
+            self._ns_window = ns_window
+        ns_window_color = NSColor.colorWithDeviceRed_green_blue_alpha_(c.redF(), c.greenF(), c.blueF(), c.alphaF())
+        self._ns_window.setBackgroundColor_(ns_window_color)
+        self._ns_window_state = state
 
     @staticmethod
     def update_available():
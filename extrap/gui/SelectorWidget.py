@@ -36,6 +36,9 @@ class SelectorWidget(QWidget):
         self._sections_switched = False
         self.min_value = 0
         self.max_value = 0
+        # incremented whenever the minimum or maximum value is recalculated
+        self.min_max_version = 0
+        self._min_max_inputs = None
 
     # noinspection PyAttributeOutsideInit
     def initUI(self):
@@ -242,6 +245,7 @@ class SelectorWidget(QWidget):
         self.main_widget.on_selection_changed()
         self.update()
 
+    @Slot()
     def model_rename(self):
         index = self.getModelIndex()
         if index < 0:
@@ -253,6 +257,7 @@ class SelectorWidget(QWidget):
         if result[1] and new_name:
             self.renameCurrentModel(new_name)
 
+    @Slot()
     def model_delete(self):
         reply = QMessageBox.question(self,
                                      'Delete Current Model',
@@ -268,6 +273,7 @@ class SelectorWidget(QWidget):
             self.model_selector.removeItem(index)
             del experiment.modelers[index]
 
+    @Slot()
     def delete_metric(self):
         reply = QMessageBox.question(self,
                                      'Delete Current Metric',
@@ -337,19 +343,26 @@ class SelectorWidget(QWidget):
             appear in the call tree. This information is e.g. used to scale
             legends ot the color line at the bottom of the extrap window.
         """
-        min_max_value = (0, 0)
         experiment = self.main_widget.getExperiment()
-        if experiment:
-            selected_metric = self.getSelectedMetric()
-            model_set = self.getCurrentModel()
-            if selected_metric and model_set:
-                param_value_list = self.getParameterValues()
-                call_tree = experiment.call_tree
-                nodes = call_tree.get_nodes()
-                previous = numpy.seterr(divide='ignore', invalid='ignore')
-                value_list = self.iterate_children(model_set.models, param_value_list, nodes, selected_metric)
-                numpy.seterr(**previous)
-                if len(value_list) > 0:
-                    min_max_value = max(0.0, min(value_list)), max(0.0, max(value_list))
+        selected_metric = self.getSelectedMetric()
+        model_set = self.getCurrentModel()
+        param_value_list = self.getParameterValues()
+        inputs = self._min_max_inputs
+        if (inputs is not None and inputs[0] is experiment and inputs[1] is selected_metric
+                and inputs[2] is model_set and inputs[3] == param_value_list):
+            # the selected call tree nodes do not influence the values
+            return self.min_value, self.max_value
+        self._min_max_inputs = experiment, selected_metric, model_set, param_value_list
+        self.min_max_version += 1
+
+        min_max_value = (0, 0)
+        if experiment and selected_metric and model_set:
+            call_tree = experiment.call_tree
+            nodes = call_tree.get_nodes()
+            previous = numpy.seterr(divide='ignore', invalid='ignore')
+            value_list = self.iterate_children(model_set.models, param_value_list, nodes, selected_metric)
+            numpy.seterr(**previous)
+            if len(value_list) > 0:
+                min_max_value = max(0.0, min(value_list)), max(0.0, max(value_list))
         self.min_value, self.max_value = min_max_value
         return min_max_value
@@ -8,8 +8,9 @@
 from __future__ import annotations
 
 import copy
+import operator
 from enum import Enum, auto
-from typing import Optional, TYPE_CHECKING, List, Callable, Any
+from typing import Optional, TYPE_CHECKING, List, Callable, Any, Tuple
 
 import numpy
 from PySide6.QtCore import *  # @UnusedWildImport
@@ -22,8 +23,13 @@ from extrap.gui.Utils import formatNumber
 from extrap.util.formatting_helper import replace_method_parameters
 
 if TYPE_CHECKING:
+    from extrap.entities.experiment import Experiment
     from extrap.gui.SelectorWidget import SelectorWidget
 
+# Callpath must have logical column index 0, because the tree structure is always shown there.
+# Severity has logical column index 1, but is visually swapped by swapSections(0,1).
+_HEADERS = ("Callpath", "Severity", "Annotations", "Value", "RSS", "Adj. R²", "SMAPE", "RE")
+
 
 def _format_number_segmented_model(segmented_model: SegmentedModel, selector: Callable[[Model], Any]) -> str:
     val = formatNumber(str(selector(segmented_model))) + "\n"
@@ -32,12 +38,28 @@ def _format_number_segmented_model(segmented_model: SegmentedModel, selector: Ca
     return val
 
 
+def _hypothesis_value_formatter(name: str):
+    get_value = operator.attrgetter('hypothesis.' + name)
+
+    def format_hypothesis_value(self, role, call_tree_node, model):
+        if role == Qt.ToolTipRole and isinstance(model, SegmentedModel):
+            return _format_number_segmented_model(model, get_value)
+        else:
+            return formatNumber(str(get_value(model)))
+
+    return format_hypothesis_value
+
+
 class TreeModel(QAbstractItemModel):
     def __init__(self, selector_widget: SelectorWidget, parent=None):
         super(TreeModel, self).__init__(parent)
         self.main_widget = selector_widget.main_widget
         self.selector_widget = selector_widget
         self.root_item = TreeItem(None)
+        self._selected_models = {}
+        self._selected_models_inputs = None
+        self._format_version = 0
+        self._parameter_values = None
         self.item_filter = TreeItemFilterProvider(self)
         experiment = self.main_widget.getExperiment()
         if experiment is not None:
@@ -48,7 +70,9 @@ class TreeModel(QAbstractItemModel):
     def removeRows(self, position=0, count=1, parent=QModelIndex()):
         node = self._node_from_index(parent)
         self.beginRemoveRows(parent, position, position + count - 1)
-        node.childItems.pop(position)
+        del node.child_items[position:position + count]
+        for row, item in enumerate(node.child_items[position:], position):
+            item._row = row
         self.endRemoveRows()
 
     def _node_from_index(self, index):
@@ -71,6 +95,13 @@ class TreeModel(QAbstractItemModel):
         return item.data()
 
     def data(self, index, role=None):
+        # Qt requests many roles for each cell, filter the unused ones before any other work
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            getDecorationBoxes = False
+        elif role == Qt.DecorationRole and index.column() == 1:
+            getDecorationBoxes = True
+        else:
+            return None
 
         if not self.checkIndex(index, QAbstractItemModel.CheckIndexOption.IndexIsValid):
             raise IndexError()
@@ -78,13 +109,10 @@ class TreeModel(QAbstractItemModel):
         if not index.isValid():
             return None
 
-        getDecorationBoxes = (role == Qt.DecorationRole and index.column() == 1)
         get_tooltip_annotations = (role == Qt.ToolTipRole and index.column() == 2)
 
-        if role != Qt.DisplayRole and role != Qt.ToolTipRole and not (getDecorationBoxes or get_tooltip_annotations):
-            return None
-
-        call_tree_node = index.internalPointer().data()
+        item: TreeItem = index.internalPointer()
+        call_tree_node = item.data()
         if call_tree_node is None:
             return "Invalid"
 
@@ -111,7 +139,10 @@ class TreeModel(QAbstractItemModel):
             '''
 
             # added for two-parameter models here
-            value = self.get_comparison_value(model)
+            cache = self._get_item_cache(item)
+            if 'comparison_value' not in cache:
+                cache['comparison_value'] = self.get_comparison_value(model)
+            value = cache['comparison_value']
 
             # convert value to relative value between 0 and 1
             relativeValue = max(0.0, (value - self.main_widget.min_value) / delta)
@@ -121,81 +152,99 @@ class TreeModel(QAbstractItemModel):
         if get_tooltip_annotations:
             if model.annotations:
                 parameters = self.main_widget.getExperiment().parameters
-                parameter_values = self.selector_widget.getParameterValues()
+                parameter_values = self.get_parameter_values()
                 return "\n".join(ann.title(parameters=parameters,
                                            parameter_values=parameter_values)
                                  for ann in model.annotations)
             return None
 
-        if index.column() == 0:
-            if self.selector_widget.show_parameters.isChecked():
-                return call_tree_node.name
-            else:
-                return replace_method_parameters(call_tree_node.name)
-        elif index.column() == 2:
-            if model.annotations:
-                parameters = self.main_widget.getExperiment().parameters
-                parameter_values = self.selector_widget.getParameterValues()
-                return [ann.icon(parameters=parameters,
-                                 parameter_values=parameter_values)
-                        for ann in model.annotations]
-        elif index.column() == 3:
-            experiment = self.main_widget.getExperiment()
+        column_data = self._COLUMN_DATA[index.column()]
+        if column_data is None:
+            return None
 
-            formula = model.hypothesis.function
-            if self.selector_widget.asymptoticCheckBox.isChecked():
-                parameters = tuple(experiment.parameters)
-                return formatFormula(formula.to_string(*parameters))
-            else:
-                parameters = self.selector_widget.getParameterValues()
-                previous = numpy.seterr(divide='ignore', invalid='ignore')
-                if role == Qt.ToolTipRole and isinstance(model, SegmentedModel):
-                    res = _format_number_segmented_model(model, lambda m: m.hypothesis.function.evaluate(parameters))
-                else:
-                    res = formatNumber(str(formula.evaluate(parameters)))
-                numpy.seterr(**previous)
-                return res
-        elif index.column() == 4:
-            if role == Qt.ToolTipRole and isinstance(model, SegmentedModel):
-                return _format_number_segmented_model(model, lambda m: m.hypothesis.RSS)
-            else:
-                return formatNumber(str(model.hypothesis.RSS))
-        elif index.column() == 5:
-            if role == Qt.ToolTipRole and isinstance(model, SegmentedModel):
-                return _format_number_segmented_model(model, lambda m: m.hypothesis.AR2)
-            else:
-                return formatNumber(str(model.hypothesis.AR2))
-        elif index.column() == 6:
-            if role == Qt.ToolTipRole and isinstance(model, SegmentedModel):
-                return _format_number_segmented_model(model, lambda m: m.hypothesis.SMAPE)
-            else:
-                return formatNumber(str(model.hypothesis.SMAPE))
-        elif index.column() == 7:
+        cache = self._get_item_cache(item)
+        key = (index.column(), role)
+        if key not in cache:
+            cache[key] = column_data(self, role, call_tree_node, model)
+        return cache[key]
+
+    def _get_item_cache(self, item: TreeItem) -> dict:
+        # the displayed values only change with the selection or in between calls of valuesChanged
+        if item.format_version != self._format_version:
+            item.format_cache.clear()
+            item.format_version = self._format_version
+        return item.format_cache
+
+    def _callpath_name(self, role, call_tree_node, model):
+        if self.selector_widget.show_parameters.isChecked():
+            return call_tree_node.name
+        else:
+            return replace_method_parameters(call_tree_node.name)
+
+    def _annotation_icons(self, role, call_tree_node, model):
+        if model.annotations:
+            parameters = self.main_widget.getExperiment().parameters
+            parameter_values = self.get_parameter_values()
+            return [ann.icon(parameters=parameters,
+                             parameter_values=parameter_values)
+                    for ann in model.annotations]
+        return None
+
+    def _model_value(self, role, call_tree_node, model):
+        experiment = self.main_widget.getExperiment()
+
+        formula = model.hypothesis.function
+        if self.selector_widget.asymptoticCheckBox.isChecked():
+            parameters = tuple(experiment.parameters)
+            return formatFormula(formula.to_string(*parameters))
+        else:
+            parameters = self.get_parameter_values()
+            previous = numpy.seterr(divide='ignore', invalid='ignore')
             if role == Qt.ToolTipRole and isinstance(model, SegmentedModel):
-                return _format_number_segmented_model(model, lambda m: m.hypothesis.RE)
+                res = _format_number_segmented_model(model, lambda m: m.hypothesis.function.evaluate(parameters))
             else:
-                return formatNumber(str(model.hypothesis.RE))
-        return None
+                res = formatNumber(str(formula.evaluate(parameters)))
+            numpy.seterr(**previous)
+            return res
+
+    # Provides the data of each column, indexed by column; must match _HEADERS
+    _COLUMN_DATA = (_callpath_name, None, _annotation_icons, _model_value,
+                    _hypothesis_value_formatter('RSS'), _hypothesis_value_formatter('AR2'),
+                    _hypothesis_value_formatter('SMAPE'), _hypothesis_value_formatter('RE'))
+
+    def get_parameter_values(self):
+        """ Returns the parameter values of the selector widget, which are read once in between calls of
+            valuesChanged.
+        """
+        if self._parameter_values is None:
+            self._parameter_values = self.selector_widget.getParameterValues()
+        return self._parameter_values
 
     def get_comparison_value(self, model):
-        parameters = self.selector_widget.getParameterValues()
+        parameters = self.get_parameter_values()
         formula = model.hypothesis.function
         previous = numpy.seterr(divide='ignore', invalid='ignore')
         value = formula.evaluate(parameters)
         numpy.seterr(**previous)
         return value
 
-    def getSelectedModel(self, callpath) -> Optional[Model]:
+    def getSelectedModel(self, callpath) -> Tuple[Optional[Model], Optional[Experiment]]:
         experiment = self.main_widget.getExperiment()
-        model = self.selector_widget.getCurrentModel()
+        model_set = self.selector_widget.getCurrentModel()
         metric = self.selector_widget.getSelectedMetric()
-        if model is None or metric is None:
-            return None
-        key = (callpath, metric)
-        if key in model.models:
-            return model.models[key], experiment  # might be None
-        else:
+        if model_set is None or metric is None:
             return None, experiment
+        inputs = self._selected_models_inputs
+        if inputs is None or inputs[0] is not model_set or inputs[1] is not metric:
+            self._selected_models.clear()
+            self._selected_models_inputs = model_set, metric
+            self._format_version += 1
+        try:
+            model = self._selected_models[callpath]
+        except KeyError:
+            model = model_set.models.get((callpath, metric))  # might be None
+            self._selected_models[callpath] = model
+        return model, experiment
 
     def on_metric_changed(self):
 
@@ -226,29 +275,11 @@ class TreeModel(QAbstractItemModel):
         return Qt.ItemIsEnabled | Qt.ItemIsSelectable
 
     def columnCount(self, _=None):
-        return 8  # This needs to be updated when a new column is added!
+        return len(_HEADERS)
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
-        if role == Qt.DisplayRole:
-            if section == 0:
-                # This must have logical column index 0, because the tree structure is always shown there
-                return "Callpath"
-            elif section == 1:
-                # Severity has logical column index 1, but is visually swapped by swapSections(0,1)
-                return "Severity"
-            elif section == 2:
-                return "Annotations"
-            elif section == 3:
-                return "Value"
-            elif section == 4:
-                return "RSS"
-            elif section == 5:
-                return "Adj. R²"
-            elif section == 6:
-                return "SMAPE"
-            elif section == 7:
-                return "RE"
-
+        if role == Qt.DisplayRole and 0 <= section < len(_HEADERS):
+            return _HEADERS[section]
         return None
 
     def index(self, row, column, parent=QModelIndex()):
@@ -276,16 +307,13 @@ class TreeModel(QAbstractItemModel):
             return QModelIndex()
 
         childItem: TreeItem = index.internalPointer()
-        if childItem == self.root_item:
+        if childItem is self.root_item:
             return QModelIndex()
 
         parentItem = childItem.parent()
-        if parentItem == self.root_item:
-            return QModelIndex()
-        try:
-            return self.createIndex(parentItem.row(), 0, parentItem)
-        except ValueError:
+        if parentItem is self.root_item:
             return QModelIndex()
+        return self.createIndex(parentItem.row(), 0, parentItem)
 
     def rowCount(self, parent=None):
         if parent is None:
@@ -304,20 +332,36 @@ class TreeModel(QAbstractItemModel):
         return len(parentItem.child_items)
 
     def valuesChanged(self):
+        # the models of the current selection might have been replaced
+        self._selected_models.clear()
+        self._selected_models_inputs = None
+        self._format_version += 1
+        self._parameter_values = None
         if not self.main_widget.getExperiment():
             return
 
-        self.dataChanged.emit(QModelIndex(), QModelIndex())  # The whole tree changed its values
+        num_rows = len(self.root_item.child_items)
+        if num_rows > 0:
+            # The whole tree changed its values, the views repaint the expanded children within the range, too
+            self.dataChanged.emit(self.index(0, 0), self.index(num_rows - 1, self.columnCount() - 1),
+                                  [Qt.DisplayRole, Qt.DecorationRole, Qt.ToolTipRole])
 
 
 class TreeItem(object):
+    __slots__ = ('parent_item', 'call_tree_node', 'child_items', 'is_skip_item', 'format_cache', 'format_version',
+                 '_row')
+
     def __init__(self, call_tree_node, parent=None):
         self.parent_item = parent
         self.call_tree_node: calltree.Node = call_tree_node
         self.child_items: List[TreeItem] = []
         self.is_skip_item = False
+        self.format_cache = {}
+        self.format_version = None
+        self._row = 0
 
     def appendChild(self, item):
+        item._row = len(self.child_items)
         self.child_items.append(item)
 
     def child(self, row):
@@ -330,9 +374,7 @@ class TreeItem(object):
         return self.parent_item
 
     def row(self):
-        if self.parent_item:
-            return self.parent_item.child_items.index(self)
-        return 0
+        return self._row
 
 
 class TreeItemFilterProvider:
@@ -425,72 +467,90 @@ class TreeItemFilterProvider:
 
     @staticmethod
     def is_tree_changed(old_tree: TreeItem, new_tree: TreeItem):
-        if len(old_tree.child_items) != len(new_tree.child_items):
-            return True
-        diverge = False
-        for i in range(len(old_tree.child_items)):
-            old_node = old_tree.child_items[i]
-            new_node = new_tree.child_items[i]
-            if old_node.call_tree_node.name != new_node.call_tree_node.name:
-                diverge = True
-                break
-            else:
-                diverge = TreeItemFilterProvider.is_tree_changed(old_node, new_node)
-        return diverge
+        stack = [(old_tree, new_tree)]
+        while stack:
+            old_tree, new_tree = stack.pop()
+            if len(old_tree.child_items) != len(new_tree.child_items):
+                return True
+            for old_node, new_node in zip(old_tree.child_items, new_tree.child_items):
+                if old_node.call_tree_node.name != new_node.call_tree_node.name:
+                    return True
+                stack.append((old_node, new_node))
+        return False
+
+    # The tree builders traverse the call tree using an explicit stack instead of recursion,
+    # so that deep call trees do not exceed the recursion limit.
 
     @staticmethod
     def _construct_tree_exclude_child_if_mismatch(ct_node: Node, parent: TreeItem,
                                                   predicate: Callable[[Node], bool]):
-        if predicate(ct_node):
-            node = TreeItem(ct_node, parent)
-            parent.appendChild(node)
-            for ct_child in ct_node:
-                TreeItemFilterProvider._construct_tree_exclude_child_if_mismatch(ct_child, node, predicate)
+        stack = [(ct_node, parent)]
+        while stack:
+            ct_node, parent = stack.pop()
+            if predicate(ct_node):
+                node = TreeItem(ct_node, parent)
+                parent.appendChild(node)
+                stack.extend((ct_child, node) for ct_child in reversed(ct_node.childs))
 
     @staticmethod
     def _construct_tree_include_child_if_mismatch(ct_node: Node, parent: TreeItem,
                                                   predicate: Callable[[Node], bool]):
-        node = TreeItem(ct_node, parent)
-        for ct_child in ct_node:
-            TreeItemFilterProvider._construct_tree_include_child_if_mismatch(ct_child, node, predicate)
-        if node.child_items or predicate(ct_node):
-            parent.appendChild(node)
+        # post-order traversal: a node is attached after all its children have been processed
+        stack = [(TreeItem(ct_node, parent), iter(ct_node.childs))]
+        while stack:
+            node, ct_children = stack[-1]
+            ct_child = next(ct_children, None)
+            if ct_child is not None:
+                stack.append((TreeItem(ct_child, node), iter(ct_child.childs)))
+                continue
+            stack.pop()
+            if node.child_items or predicate(node.call_tree_node):
+                node.parent_item.appendChild(node)
 
     @staticmethod
     def _construct_tree_flat(ct_node: Node, parent: TreeItem,
                              predicate: Callable[[Node], bool]):
-        if predicate(ct_node):
-            parent.appendChild(TreeItem(ct_node, parent))
-        for ct_child in ct_node:
-            TreeItemFilterProvider._construct_tree_flat(ct_child, parent, predicate)
+        stack = [ct_node]
+        while stack:
+            ct_node = stack.pop()
+            if predicate(ct_node):
+                parent.appendChild(TreeItem(ct_node, parent))
+            stack.extend(reversed(ct_node.childs))
 
     @staticmethod
     def _construct_tree_skip_if_mismatch_and_at_most_one_child(ct_node: Node, parent: TreeItem,
                                                                predicate: Callable[[Node], bool]):
-        node = TreeItem(ct_node, parent)
-        for ct_child in ct_node:
-            TreeItemFilterProvider._construct_tree_skip_if_mismatch_and_at_most_one_child(ct_child, node, predicate)
-        if predicate(ct_node) or len(node.child_items) > 1:
-            parent.appendChild(node)
-        elif len(node.child_items) == 1:
-            child = node.child_items[0]
-            if child.is_skip_item:
-                child.call_tree_node.name = ct_node.name + '->' + child.call_tree_node.name
-                child.parent_item = parent
-                parent.child_items.append(child)
-            else:
-                node.is_skip_item = True
-                node.call_tree_node = copy.copy(node.call_tree_node)
+        # post-order traversal: a node is attached after all its children have been processed
+        stack = [(TreeItem(ct_node, parent), iter(ct_node.childs))]
+        while stack:
+            node, ct_children = stack[-1]
+            ct_child = next(ct_children, None)
+            if ct_child is not None:
+                stack.append((TreeItem(ct_child, node), iter(ct_child.childs)))
+                continue
+            stack.pop()
+            ct_node, parent = node.call_tree_node, node.parent_item
+            if predicate(ct_node) or len(node.child_items) > 1:
                 parent.appendChild(node)
+            elif len(node.child_items) == 1:
+                child = node.child_items[0]
+                if child.is_skip_item:
+                    child.call_tree_node.name = ct_node.name + '->' + child.call_tree_node.name
+                    child.parent_item = parent
+                    parent.appendChild(child)
+                else:
+                    node.is_skip_item = True
+                    node.call_tree_node = copy.copy(node.call_tree_node)
+                    parent.appendChild(node)
 
     @staticmethod
     def _construct_tree_skip_if_mismatch(ct_node: Node, parent: TreeItem,
                                          predicate: Callable[[Node], bool]):
-        if predicate(ct_node):
-            node = TreeItem(ct_node, parent)
-            parent.appendChild(node)
-            for ct_child in ct_node:
-                TreeItemFilterProvider._construct_tree_skip_if_mismatch(ct_child, node, predicate)
-        else:
-            for ct_child in ct_node:
-                TreeItemFilterProvider._construct_tree_skip_if_mismatch(ct_child, parent, predicate)
+        stack = [(ct_node, parent)]
+        while stack:
+            ct_node, parent = stack.pop()
+            if predicate(ct_node):
+                node = TreeItem(ct_node, parent)
+                parent.appendChild(node)
+                parent = node
+            stack.extend((ct_child, parent) for ct_child in reversed(ct_node.childs))
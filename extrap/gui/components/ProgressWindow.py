@@ -7,7 +7,7 @@
 
 from threading import Event
 
-from PySide6.QtCore import Qt, QCoreApplication, Slot
+from PySide6.QtCore import Qt, QCoreApplication, Slot, QObject, Signal, QThread
 from PySide6.QtWidgets import QProgressDialog, QLabel, QWidget, QVBoxLayout, QProgressBar, QApplication
 
 from extrap.util.exceptions import CancelProcessError
@@ -24,6 +24,19 @@ def format_progress_time_for_gui(pbar: ProgressBar):
     return time_str
 
 
+class _DisplayForwarder(QObject):
+    requested = Signal()
+
+    def __init__(self, progress_window):
+        super().__init__()
+        self._progress_window = progress_window
+        self.requested.connect(self.display)
+
+    @Slot()
+    def display(self):
+        self._progress_window.display()
+
+
 class ProgressWindow(ProgressBar):
     def __init__(self, parent, title, **kwargs):
         super().__init__(total=0, desc=title, **kwargs, gui=True)
@@ -43,6 +56,8 @@ class ProgressWindow(ProgressBar):
         self._cancel_event = Event()
         self._internal_cancel_event = Event()
         self.dialog.canceled.connect(self.user_cancel)
+        # updates from worker threads are displayed by the thread owning the dialog
+        self._display_forwarder = _DisplayForwarder(self)
         # self.dialog.show()
 
     def close(self):
@@ -70,6 +85,9 @@ class ProgressWindow(ProgressBar):
         super(ProgressWindow, self).update(n)
 
     def display(self, msg=None, pos=None):
+        if QThread.currentThread() is not self.dialog.thread():
+            self._display_forwarder.requested.emit()
+            return
         time_str = format_progress_time_for_gui(self)
 
         if not self._cancel_event.is_set():
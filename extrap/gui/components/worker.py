@@ -5,7 +5,11 @@
 # This software may be modified and distributed under the terms of a BSD-style license.
 # See the LICENSE file in the base directory for details.
 
-from PySide6.QtCore import Slot, QRunnable, QObject
+import logging
+import threading
+import warnings
+
+from PySide6.QtCore import Slot, QRunnable, QObject, Signal, QEventLoop, QThreadPool
 
 
 class Worker(QRunnable):
@@ -32,3 +36,95 @@ class MTWorker(QObject):
     @Slot()  # QtCore.Slot
     def run(self):
         self.function(*self.args, **self.kwargs)
+
+
+class _TaskSignals(QObject):
+    finished = Signal()
+
+
+class _BackgroundTask(QRunnable):
+    def __init__(self, function, *args, **kwargs):
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.result = None
+        self.exception = None
+        # created in the calling thread, so that finished is delivered to its event loop
+        self.signals = _TaskSignals()
+        self.setAutoDelete(False)
+
+    @Slot()  # QtCore.Slot
+    def run(self):
+        try:
+            self.result = self.function(*self.args, **self.kwargs)
+        except BaseException as e:
+            self.exception = e
+        finally:
+            self.signals.finished.emit()
+
+
+class _DeferredLogHandler(logging.Handler):
+    """
+    Replaces the handlers of the root logger while a background task runs.
+    Records of the calling thread are passed on to the replaced handlers, records of all other threads are stored
+    until they can be passed on in the calling thread.
+    """
+
+    def __init__(self, handlers):
+        super().__init__()
+        self.handlers = handlers
+        self.thread = threading.get_ident()
+        self.records = []
+
+    def emit(self, record):
+        if record.thread == self.thread:
+            self.forward(record)
+        else:
+            self.records.append(record)
+
+    def forward(self, record):
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def run_in_background(function, *args, **kwargs):
+    """
+    Runs the function on the global thread pool and keeps processing GUI events until it has finished.
+    Returns the result of the function or reraises its exception in the calling thread.
+    The GUI handles warnings and log records with widgets, therefore, the warnings and log records of the background
+    thread are collected and shown in the calling thread after the function has finished.
+    """
+    thread = threading.get_ident()
+    deferred_warnings = []
+    show_warning = warnings.showwarning
+
+    def _show_warning(message, category, filename, lineno, file=None, line=None):
+        if threading.get_ident() == thread:
+            show_warning(message, category, filename, lineno, file, line)
+        else:
+            deferred_warnings.append((message, category, filename, lineno, file, line))
+
+    root_logger = logging.getLogger()
+    log_handlers = root_logger.handlers[:]
+    log_handler = _DeferredLogHandler(log_handlers)
+
+    task = _BackgroundTask(function, *args, **kwargs)
+    loop = QEventLoop()
+    task.signals.finished.connect(loop.quit)
+    warnings.showwarning = _show_warning
+    root_logger.handlers = [log_handler]
+    try:
+        QThreadPool.globalInstance().start(task)
+        loop.exec()
+    finally:
+        root_logger.handlers = log_handlers
+        warnings.showwarning = show_warning
+        for record in log_handler.records:
+            log_handler.forward(record)
+        for warning in deferred_warnings:
+            show_warning(*warning)
+    if task.exception is not None:
+        raise task.exception
+    return task.result
@@ -50,22 +50,13 @@ class AllFunctionsAsDifferentSurfacePlot(GraphDisplayWindow):
             left=left, bottom=bottom, right=right, top=top, wspace=wspace, hspace=hspace)
 
         # Set the x_label and y_label based on parameter selected.
-        x_label = self.main_widget.data_display.getAxisParameter(0).name
-        if x_label.startswith("_"):
-            x_label = x_label[1:]
-        y_label = self.main_widget.data_display.getAxisParameter(1).name
-        if y_label.startswith("_"):
-            y_label = y_label[1:]
+        x_label, y_label = self.get_axis_labels()
 
         # Draw the graphs in subplots
         for i in range(len(Z_List)):
             ax = self.fig.add_subplot(
                 1, number_of_subplots, i + 1, projection='3d')
-            ax.mouse_init()
-            ax.get_xaxis().get_major_formatter().set_scientific(True)
-            ax.xaxis.major.formatter._useMathText = True
-            ax.yaxis.major.formatter._useMathText = True
-            ax.zaxis.major.formatter._useMathText = True
+            ax.ticklabel_format(style='sci', useMathText=True)
             ax.plot_surface(
                 X, Y, Z_List[i], color=dict_callpath_color[selected_callpaths[i]])
             ax.set_xlabel('\n' + x_label)
@@ -39,12 +39,7 @@ class AllFunctionsAsOneSurfacePlot(GraphDisplayWindow):
         # colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
 
         # Set the x_label and y_label based on parameter selected.
-        x_label = self.main_widget.data_display.getAxisParameter(0).name
-        if x_label.startswith("_"):
-            x_label = x_label[1:]
-        y_label = self.main_widget.data_display.getAxisParameter(1).name
-        if y_label.startswith("_"):
-            y_label = y_label[1:]
+        x_label, y_label = self.get_axis_labels()
 
         # 1 because we are going to show all the models in same plot
         number_of_subplots = 1
@@ -52,11 +47,7 @@ class AllFunctionsAsOneSurfacePlot(GraphDisplayWindow):
         # Draw all the selected models
         ax_all = self.fig.add_subplot(
             1, number_of_subplots, 1, projection='3d')
-        ax_all.mouse_init()
-        ax_all.get_xaxis().get_major_formatter().set_scientific(True)
-        ax_all.xaxis.major.formatter._useMathText = True
-        ax_all.yaxis.major.formatter._useMathText = True
-        ax_all.zaxis.major.formatter._useMathText = True
+        ax_all.ticklabel_format(style='sci', useMathText=True)
         ax_all.set_xlabel('\n' + x_label)
         ax_all.set_ylabel('\n' + y_label, linespacing=3.1)
         ax_all.set_zlabel(
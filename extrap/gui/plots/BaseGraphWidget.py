@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING
 import matplotlib
 import numpy as np
 from PySide6.QtWidgets import QSizePolicy
-from matplotlib import patches as mpatches
+from matplotlib import colormaps, patches as mpatches
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D
@@ -25,9 +25,14 @@ if TYPE_CHECKING:
 
 
 class GraphDisplayWindow(FigureCanvas):
+    # shared by all plots, the registry creates a new copy for each lookup
+    colormap = colormaps['viridis']
+
     def __init__(self, graphWidget, main_widget: MainWidget, width=5, height=4, dpi=100):
         self.graphWidget = graphWidget
         self.main_widget = main_widget
+        self._grid_cache = None
+        self._legend_cache = None
         with matplotlib.rc_context({'font.family': self.main_widget.plot_formatting_options.font_family,
                                     'font.size': self.main_widget.plot_formatting_options.font_size}):
             self.fig = Figure(figsize=(width, height), dpi=dpi, layout='tight')
@@ -75,10 +80,20 @@ class GraphDisplayWindow(FigureCanvas):
         pixelGap = (upperlimit - lowerlimit) / numberOfPixels
         return pixelGap
 
-    def calculate_z_optimized(self, X, Y, function):
+    def calculate_z_optimized(self, X, Y, function, points=None):
         """
            This function evaluates the function passed to it.
         """
+        if points is None:
+            points = self.calculate_grid_points(X, Y)
+        z_value = function.evaluate(points)
+        return z_value
+
+    def calculate_grid_points(self, X, Y):
+        """
+           This function creates the points of the grid with one row per parameter,
+           the parameters not shown on the axes are set to their selected values.
+        """
         xs, ys = X.reshape(-1), Y.reshape(-1)
         points = np.ndarray((len(self.main_widget.data_display.parameters), len(xs)))
 
@@ -91,48 +106,91 @@ class GraphDisplayWindow(FigureCanvas):
             points[param1] = xs
         if param2 >= 0:
             points[param2] = ys
+        return points
 
-        z_value = function.evaluate(points)
-        return z_value
+    def calculate_grid(self, maxX, maxY):
+        """
+           This function returns the grid of the x and y values,
+           it is reused by further redraws as long as the grid parameters do not change.
+        """
+        # define grid parameters based on max x and max y value
+        key = (maxX, maxY, *self._calculate_grid_parameters(maxX, maxY))
+        if self._grid_cache is None or self._grid_cache[0] != key:
+            _, _, pixelGap_x, pixelGap_y = key
+            x = np.arange(1.0, maxX, pixelGap_x)
+            y = np.arange(1.0, maxY, pixelGap_y)
+            X, Y = np.meshgrid(x, y)
+            # the grid is shared between redraws, so it must not be modified
+            X.flags.writeable = False
+            Y.flags.writeable = False
+            self._grid_cache = key, X, Y
+        return self._grid_cache[1:]
 
     def calculate_z_models(self, maxX, maxY, model_list, max_z=0):
-        # define grid parameters based on max x and max y value
-        pixelGap_x, pixelGap_y = self._calculate_grid_parameters(maxX, maxY)
         # Get the grid of the x and y values
-        x = np.arange(1.0, maxX, pixelGap_x)
-        y = np.arange(1.0, maxY, pixelGap_y)
-        X, Y = np.meshgrid(x, y)
+        X, Y = self.calculate_grid(maxX, maxY)
+        # the points are shared by all models
+        points = self.calculate_grid_points(X, Y)
         # Get the z value for the x and y value
         z_List = list()
         Z_List = list()
         previous = np.seterr(invalid='ignore', divide='ignore')
         for model in model_list:
             function = model.hypothesis.function
-            zs = self.calculate_z_optimized(X, Y, function)
+            zs = self.calculate_z_optimized(X, Y, function, points)
             Z = zs.reshape(X.shape)
             z_List.append(zs)
             Z_List.append(Z)
             max_z = max(max_z, np.max(zs[np.logical_not(np.isinf(zs))]))
         np.seterr(**previous)
-        for z, Z in zip(z_List, Z_List):
+        # Z is a view of z, so the values are replaced in both
+        for z in z_List:
             z[np.isinf(z)] = max_z
-            Z[np.isinf(Z)] = max_z
         return X, Y, Z_List, z_List
 
+    @staticmethod
+    def calculate_max_z(z_List):
+        """
+           This function calculates the max z value over all models for each point
+           and returns it together with the index of the model that reaches it.
+        """
+        zs = np.stack(z_List)
+        # nan values never dominate, the first model wins in case of ties
+        max_indices = np.argmax(np.where(np.isnan(zs), -np.inf, zs), axis=0)
+        max_z = np.take_along_axis(zs, max_indices[np.newaxis], axis=0)[0]
+        return max_z, max_indices
+
     def draw_legend(self, ax_all, dict_callpath_color):
-        # draw legend
-        patches = list()
-        for key, value in dict_callpath_color.items():
-            labelName = str(key.name)
-            if labelName.startswith("_"):
-                labelName = labelName[1:]
-            patch = mpatches.Patch(color=value, label=replace_method_parameters(labelName))
-            patches.append(patch)
+        # draw legend, the patches are reused as long as the colors of the call paths do not change
+        key = tuple(dict_callpath_color.items())
+        if self._legend_cache is None or self._legend_cache[0] != key:
+            patches = list()
+            for callpath, value in key:
+                labelName = self.get_display_name(str(callpath.name))
+                patch = mpatches.Patch(color=value, label=replace_method_parameters(labelName))
+                patches.append(patch)
+            self._legend_cache = key, patches
+        patches = self._legend_cache[1]
         leg = ax_all.legend(handles=patches, fontsize=self.main_widget.plot_formatting_options.legend_font_size,
                             loc="upper right", bbox_to_anchor=(1, 1))
         if leg:
             leg.set_draggable(True)
 
+    @staticmethod
+    def get_display_name(name: str):
+        """
+           This function removes the leading underscore from the name of a parameter or call path.
+        """
+        return name[1:] if name.startswith("_") else name
+
+    def get_axis_labels(self):
+        """
+           This function returns the display names of the parameters shown on the x and y axis.
+        """
+        data_display = self.main_widget.data_display
+        return (self.get_display_name(data_display.getAxisParameter(0).name),
+                self.get_display_name(data_display.getAxisParameter(1).name))
+
     def get_max(self, lower_max=2.0):
         # since we are drawing the plots with minimum axis value of 1 to avoid nan values,
         # so the first max-value of parameter could be 2 to calculate number of subdivisions
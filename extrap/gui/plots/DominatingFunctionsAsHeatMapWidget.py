@@ -6,11 +6,12 @@
 # See the LICENSE file in the base directory for details.
 
 import sys
+from bisect import bisect_left
 
 import matplotlib.patches as mpatches
 import numpy as np
 from PySide6.QtWidgets import *  # @UnusedWildImport
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.colors import LinearSegmentedColormap, to_rgba_array
 from matplotlib.figure import Figure
 
 from extrap.gui.plots.BaseGraphWidget import GraphDisplayWindow
@@ -20,6 +21,10 @@ from extrap.gui.plots.BaseGraphWidget import GraphDisplayWindow
 
 
 class DominatingFunctionsAsHeatMap(GraphDisplayWindow):
+    # the number of pixels decreases for larger max values, each bound belongs to the lower range
+    PIXEL_BOUNDS = (1000, 1000000000)
+    NUMBER_OF_PIXELS = (100, 75, 50)
+
     def __init__(self, heatMapGraphWidget, width=5, height=4, dpi=100):
 
         self.heatMapGraphWidget = heatMapGraphWidget
@@ -45,20 +50,8 @@ class DominatingFunctionsAsHeatMap(GraphDisplayWindow):
         maxX = self.heatMapGraphWidget.getMaxX()
         maxY = self.heatMapGraphWidget.getMaxY()
 
-        # 100, 75, 50
-        if maxX <= 1000:
-            numberOfPixels_x = 100
-        elif 1000 < maxX <= 1000000000:
-            numberOfPixels_x = 75
-        else:
-            numberOfPixels_x = 50
-
-        if maxY <= 1000:
-            numberOfPixels_y = 100
-        elif 1000 < maxY <= 1000000000:
-            numberOfPixels_y = 75
-        else:
-            numberOfPixels_y = 50
+        numberOfPixels_x = self.NUMBER_OF_PIXELS[bisect_left(self.PIXEL_BOUNDS, maxX)]
+        numberOfPixels_y = self.NUMBER_OF_PIXELS[bisect_left(self.PIXEL_BOUNDS, maxY)]
 
         # print("max x:", maxX, "max y:", maxY)
         pixelGap_x = self.getPixelGap(lowerlimit, maxX, numberOfPixels_x)
@@ -76,11 +69,11 @@ class DominatingFunctionsAsHeatMap(GraphDisplayWindow):
         # functions.append("1.95*10**4+81.8*np.log(x)*y**(7/4) +4.62*10**3*y**(7/4)")
         functions.append("9.82+9.62*10**-3*x*y**(3/2)")
 
+        xs, ys = X.ravel(), Y.ravel()
         for i in range(len(functions)):
             func = functions[i]
             # print ( "func", functions[i])
-            zs = np.array([self.calculate_z(x, y, eval(func))
-                           for x, y in zip(np.ravel(X), np.ravel(Y))])
+            zs = self.calculate_z(xs, ys, func)
             Z = zs.reshape(X.shape)
             z_List.append(zs)
             Z_List.append(Z)
@@ -98,44 +91,20 @@ class DominatingFunctionsAsHeatMap(GraphDisplayWindow):
         # for which z is highest.
         # Also store the the associated z value.
 
-        max_z_val = z_List[0][0]
-        color_for_max_z = dict_callpath_color[functions[0]]
-        max_z_list = list()
-        max_color_list = list()
-        max_function_list = list()
-
-        for i in range(len(z_List[0])):
-            for j in range(len(functions)):
-                if z_List[j][i] > max_z_val:
-                    max_z_val = z_List[j][i]
-                    func_with_max_z = functions[j]
-                    color_for_max_z = dict_callpath_color[func_with_max_z]
-            max_z_list.append(max_z_val)
-            max_function_list.append(func_with_max_z)
-            max_color_list.append(color_for_max_z)
-
-        # indicesList = list()
-        function_indices_map = {}
-        for i in range(len(functions)):
-            indices = self.get_dominating_function_indices(
-                functions[i], max_function_list)
-            if indices:
-                function_indices_map[functions[i]] = indices
-        # print ("function_indices_map", function_indices_map)
+        max_z_list, max_indices = self.calculate_max_z(z_List)
+        palette = to_rgba_array([dict_callpath_color[function] for function in functions])
 
-        max_Z_List = np.array(max_z_list).reshape(X.shape)
-        max_Color_List = np.array(max_color_list).reshape(X.shape)
+        max_Z_List = max_z_list.reshape(X.shape)
 
         ax1 = self.fig.add_subplot(1, 1, 1)
         ax1.set_xlabel(r'X')
         ax1.set_ylabel(r'Y')
         ax1.set_title(r'Dominating Functions')
-        for (x, y, colour) in zip(X, Y, max_Color_List):
-            ax1.scatter(x, y, c=colour)
+        ax1.scatter(X.ravel(), Y.ravel(), c=palette[max_indices])
 
         numOfCurves = 12
-        maxZ = max([max(row) for row in max_Z_List])
-        levels = np.arange(0, maxZ, (1 / float(numOfCurves)) * maxZ)
+        maxZ = float(np.nanmax(max_Z_List))
+        levels = np.linspace(0, maxZ, numOfCurves, endpoint=False)
         CS = ax1.contour(X, Y, max_Z_List, levels=levels)
         ax1.clabel(CS, CS.levels[::1], inline=True, fontsize=self.main_widget.plot_formatting_options.font_size * 0.8)
 
@@ -153,7 +122,9 @@ class DominatingFunctionsAsHeatMap(GraphDisplayWindow):
 
     @staticmethod
     def calculate_z(x, y, functiontoEvaluate):
-        return functiontoEvaluate
+        # evaluates the expression for all grid points at once
+        z = eval(functiontoEvaluate, {'np': np}, {'x': x, 'y': y})
+        return np.broadcast_to(z, np.shape(x)).astype(float)
 
     @staticmethod
     def populateCallPathColorMap(callpaths, colors):
@@ -175,15 +146,3 @@ class DominatingFunctionsAsHeatMap(GraphDisplayWindow):
 
     def get_callpath_color_map(self):
         return self.dict_callpath_color
-
-    @staticmethod
-    def get_dominating_function_indices(function, functionList):
-        functionIndexList = list()
-        functionIndex = -1
-        while True:
-            try:
-                functionIndex = functionList.index(function, functionIndex + 1)
-                functionIndexList.append(functionIndex)
-            except ValueError:
-                break
-        return functionIndexList
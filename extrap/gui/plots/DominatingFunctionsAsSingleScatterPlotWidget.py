@@ -5,7 +5,7 @@
 # This software may be modified and distributed under the terms of a BSD-style license.
 # See the LICENSE file in the base directory for details.
 
-import numpy as np
+from matplotlib.colors import to_rgba_array
 
 from extrap.gui.plots.BaseGraphWidget import GraphDisplayWindow
 
@@ -42,43 +42,22 @@ class DominatingFunctionsAsSingleScatterPlot(GraphDisplayWindow):
         widget = self.main_widget
         dict_callpath_color = widget.model_color_map
 
-        # calculate max_z value
+        # calculate max_z value and the color of the model it belongs to
+        max_z_list, max_indices = self.calculate_max_z(z_List)
+        # one RGBA color per model, the points select their color by the index of the dominating model
+        palette = to_rgba_array([dict_callpath_color[callpath] for callpath in selected_callpaths])
 
-        max_z_list = list()
-        max_color_list = list()
-
-        for i in range(len(z_List[0])):
-            max_z_val = z_List[0][i]
-            color_for_max_z = dict_callpath_color[selected_callpaths[0]]
-            for j in range(len(model_list)):
-                if z_List[j][i] > max_z_val:
-                    max_z_val = z_List[j][i]
-                    # func_with_max_z = model_list[j]
-                    color_for_max_z = dict_callpath_color[selected_callpaths[j]]
-            max_z_list.append(max_z_val)
-            max_color_list.append(color_for_max_z)
-
-        max_Z_List = np.array(max_z_list).reshape(X.shape)
-        max_Color_List = np.array(max_color_list).reshape(X.shape)
+        max_Z_List = max_z_list.reshape(X.shape)
 
         # Set the x_label and y_label based on parameter selected.
-        x_label = self.main_widget.data_display.getAxisParameter(0).name
-        if x_label.startswith("_"):
-            x_label = x_label[1:]
-        y_label = self.main_widget.data_display.getAxisParameter(1).name
-        if y_label.startswith("_"):
-            y_label = y_label[1:]
+        x_label, y_label = self.get_axis_labels()
 
         # Draw the graph showing the max z value
         number_of_subplots = 1
         ax = self.fig.add_subplot(1, number_of_subplots, number_of_subplots, projection='3d')
-        ax.mouse_init()
-        ax.xaxis.major.formatter._useMathText = True
-        ax.yaxis.major.formatter._useMathText = True
-        ax.zaxis.major.formatter._useMathText = True
-        ax.get_xaxis().get_major_formatter().set_scientific(True)
-        for (x, y, z, colour) in zip(X, Y, max_Z_List, max_Color_List):
-            ax.scatter(x, y, z, c=colour)
+        ax.ticklabel_format(style='sci', useMathText=True)
+        # a single scatter call creates one collection for the whole grid
+        ax.scatter(X.ravel(), Y.ravel(), max_Z_List.ravel(), c=palette[max_indices])
         ax.set_xlabel('\n' + x_label)
         ax.set_ylabel('\n' + y_label, linespacing=3.1)
         ax.set_zlabel(
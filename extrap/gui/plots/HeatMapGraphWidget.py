@@ -10,7 +10,6 @@ import sys
 
 import matplotlib.ticker as ticker
 import numpy as np
-from matplotlib import colormaps
 
 from extrap.gui.plots.BaseGraphWidget import BaseContourGraph
 
@@ -20,8 +19,6 @@ from extrap.gui.plots.BaseGraphWidget import BaseContourGraph
 
 class HeatMapGraph(BaseContourGraph):
     def __init__(self, graphWidget, main_widget, width=5, height=4, dpi=100):
-        self.colormap = colormaps['viridis']
-
         # initializing value to be used later in finding boundary points
         self.isLeft = 1
         self.isRight = -1
@@ -52,52 +49,27 @@ class HeatMapGraph(BaseContourGraph):
         # get the associated model functions for which z is highest.
         # Also store the the associated z value.
 
-        color_for_max_z = dict_callpath_color[selected_callpaths[0]]
-        max_z_list = list()
-        max_color_list = list()
-        max_function_list = list()
-        func_with_max_z = model_list[0]
-
-        for i in range(len(z_List[0])):
-            max_z_val = z_List[0][i]
-            for j in range(len(model_list)):
-                if z_List[j][i] > max_z_val:
-                    max_z_val = z_List[j][i]
-                    func_with_max_z = model_list[j]
-                    color_for_max_z = dict_callpath_color[selected_callpaths[j]]
-            max_z_list.append(max_z_val)
-            max_function_list.append(func_with_max_z)
-            max_color_list.append(color_for_max_z)
+        max_z_list, max_indices = self.calculate_max_z(z_List)
 
         # get the indices of the dominating model functions
-        # indicesList = list()
         function_indices_map = {}
         for i in range(len(model_list)):
-            indices = self.get_dominating_function_indices(
-                model_list[i], max_function_list)
-            if indices:
+            indices = np.flatnonzero(max_indices == i)
+            if len(indices) > 0:
                 function_indices_map[selected_callpaths[i]] = indices
-                # function_indices_map[model_list[i]] = indices
 
-        # reshape the Max Z and corresponding color to give plot as input
-        max_Z_List = np.array(max_z_list).reshape(X.shape)
+        # reshape the Max Z to give plot as input
+        max_Z_List = max_z_list.reshape(X.shape)
         # max_Color_List = np.array(max_color_list).reshape(X.shape)
 
         # Set the x_label and y_label based on parameter selected.
-        x_label = self.main_widget.data_display.getAxisParameter(0).name
-        if x_label.startswith("_"):
-            x_label = x_label[1:]
-        y_label = self.main_widget.data_display.getAxisParameter(1).name
-        if y_label.startswith("_"):
-            y_label = y_label[1:]
+        x_label, y_label = self.get_axis_labels()
 
         # Draw the graph showing the max z value
 
         # Step1: Draw the max Z value
         ax = self.fig.add_subplot(1, 1, 1)
-        ax.get_xaxis().get_major_formatter().set_scientific(True)
-        ax.xaxis.major.formatter._useMathText = True
-        ax.yaxis.major.formatter._useMathText = True
+        ax.ticklabel_format(style='sci', useMathText=True)
         ax.set_xlabel('\n' + x_label)
         ax.set_ylabel('\n' + y_label)
         ax.set_title('Max. Z Value')
@@ -110,8 +82,8 @@ class HeatMapGraph(BaseContourGraph):
         # function_indices_map and then find the boundary of these points and plot on the graph
         for function in function_indices_map:
             indices_per_function = function_indices_map[function]
-            x_indices = [X.ravel()[index] for index in indices_per_function]
-            y_indices = [Y.ravel()[index] for index in indices_per_function]
+            x_indices = X.ravel()[indices_per_function].tolist()
+            y_indices = Y.ravel()[indices_per_function].tolist()
             x_y_indices = list(zip(x_indices, y_indices))
             boundaryPoints = self.findBoundaryPoints(x_y_indices)
             i = 0
@@ -136,21 +108,6 @@ class HeatMapGraph(BaseContourGraph):
     #         cmap_name, colors, N=n_bin)
     #     return colorMap
 
-    @staticmethod
-    def get_dominating_function_indices(function, functionList):
-        """ 
-           This function filters the functions which are in the functionList and return their indices. 
-        """
-        functionIndexList = list()
-        functionIndex = -1
-        while True:
-            try:
-                functionIndex = functionList.index(function, functionIndex + 1)
-                functionIndexList.append(functionIndex)
-            except ValueError:
-                break
-        return functionIndexList
-
     # The below code is adapted from Stack Overflow
     # Reference: https://stackoverflow.com/questions/25787637/python-plot-only-the-outermost-points-of-a-dataset
 
@@ -9,7 +9,6 @@ import warnings
 
 import matplotlib.ticker as ticker
 import numpy as np
-from matplotlib import colormaps
 from matplotlib.colors import LinearSegmentedColormap
 
 #####################################################################
@@ -18,7 +17,6 @@ from extrap.gui.plots.BaseGraphWidget import BaseContourGraph
 
 class InterpolatedContourDisplay(BaseContourGraph):
     def __init__(self, graphWidget, main_widget, width=5, height=4, dpi=100):
-        self.colormap = colormaps['viridis']
         super().__init__(graphWidget, main_widget, width, height, dpi)
 
     def draw_figure(self):
@@ -59,26 +57,26 @@ class InterpolatedContourDisplay(BaseContourGraph):
             left=left, bottom=bottom, right=right, top=top, wspace=wspace, hspace=hspace)
 
         # Set the x_label and y_label based on parameter selected.
-        x_label = self.main_widget.data_display.getAxisParameter(0).name
-        if x_label.startswith("_"):
-            x_label = x_label[1:]
-        y_label = self.main_widget.data_display.getAxisParameter(1).name
-        if y_label.startswith("_"):
-            y_label = y_label[1:]
+        x_label, y_label = self.get_axis_labels()
 
         numOfCurves = 15
+
+        # the grid is uniform, so the values are drawn as an image whose pixels are centered on the grid points
+        x, y = X[0], Y[:, 0]
+        half_gap_x, half_gap_y = (x[1] - x[0]) / 2, (y[1] - y[0]) / 2
+        extent = (x[0] - half_gap_x, x[-1] + half_gap_x, y[0] - half_gap_y, y[-1] + half_gap_y)
         # cm = self.getColorMap()
         # cm ='viridis'
         # cm='hot'
 
         for i in range(len(Z_List)):
-            maxZ = max([max(row) for row in Z_List[i]])
+            maxZ = float(np.nanmax(Z_List[i]))
             maxZ = maxZ or 1
-            levels = np.arange(0, maxZ, (1 / float(numOfCurves)) * maxZ)
+            levels = np.linspace(0, maxZ, numOfCurves, endpoint=False)
             ax = self.fig.add_subplot(1, number_of_subplots, i + 1)
-            ax.xaxis.major.formatter._useMathText = True
-            ax.yaxis.major.formatter._useMathText = True
-            CM = ax.pcolormesh(X, Y, Z_List[i], cmap=self.colormap)
+            ax.ticklabel_format(style='sci', useMathText=True)
+            CM = ax.imshow(Z_List[i], origin='lower', extent=extent, aspect='auto', interpolation='nearest',
+                           cmap=self.colormap)
             self.fig.colorbar(CM, ax=ax, orientation="horizontal",
                               pad=0.2, format=ticker.ScalarFormatter(useMathText=True))
             try:
@@ -92,10 +90,7 @@ class InterpolatedContourDisplay(BaseContourGraph):
             ax.set_xlabel('\n' + x_label)
             ax.set_ylabel('\n' + y_label)
 
-            titleName = selected_callpaths[i].name
-            if titleName.startswith("_"):
-                titleName = titleName[1:]
-            ax.set_title(titleName)
+            ax.set_title(self.get_display_name(selected_callpaths[i].name))
             for item in ([ax.title]):
                 item.set_fontsize(font_size_legend)
 
@@ -33,12 +33,7 @@ class IsolinesDisplay(BaseContourGraph):
         X, Y, Z_List, z_List = self.calculate_z_models(maxX, maxY, model_list)
 
         # Set the x_label and y_label based on parameter selected.
-        x_label = self.main_widget.data_display.getAxisParameter(0).name
-        if x_label.startswith("_"):
-            x_label = x_label[1:]
-        y_label = self.main_widget.data_display.getAxisParameter(1).name
-        if y_label.startswith("_"):
-            y_label = y_label[1:]
+        x_label, y_label = self.get_axis_labels()
 
         # Get the callpath color map
         widget = self.main_widget
@@ -61,8 +56,7 @@ class IsolinesDisplay(BaseContourGraph):
             # Set the axis details for the subplot where we will draw all isolines
             ax_all = self.fig.add_subplot(
                 1, number_of_subplots, number_of_subplots)
-            ax_all.xaxis.major.formatter._useMathText = True
-            ax_all.yaxis.major.formatter._useMathText = True
+            ax_all.ticklabel_format(style='sci', useMathText=True)
             ax_all.set_xlabel('\n' + x_label)
             ax_all.set_ylabel('\n' + y_label)
             ax_all.set_title(r'All')
@@ -70,8 +64,7 @@ class IsolinesDisplay(BaseContourGraph):
         # Draw isolines
         for i in range(len(Z_List)):
             ax = self.fig.add_subplot(1, number_of_subplots, i + 1)
-            ax.xaxis.major.formatter._useMathText = True
-            ax.yaxis.major.formatter._useMathText = True
+            ax.ticklabel_format(style='sci', useMathText=True)
             try:
                 with warnings.catch_warnings():
                     warnings.filterwarnings('ignore', 'No contour levels were found within the data range.')
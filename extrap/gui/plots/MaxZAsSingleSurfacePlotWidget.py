@@ -6,8 +6,6 @@
 # See the LICENSE file in the base directory for details.
 
 import matplotlib.ticker as ticker
-import numpy as np
-from matplotlib import colormaps
 
 from extrap.gui.plots.BaseGraphWidget import GraphDisplayWindow
 
@@ -17,7 +15,6 @@ from extrap.gui.plots.BaseGraphWidget import GraphDisplayWindow
 
 class MaxZAsSingleSurfacePlot(GraphDisplayWindow):
     def __init__(self, graphWidget, main_widget, width=5, height=4, dpi=100):
-        self.colormap = colormaps['viridis']
         super().__init__(graphWidget, main_widget, width, height, dpi)
 
     def draw_figure(self):
@@ -41,34 +38,19 @@ class MaxZAsSingleSurfacePlot(GraphDisplayWindow):
 
         else:
             # for each x,y value , calculate max z for all function
-            max_z_list = list()
-            for i in range(len(z_List[0])):
-                max_z_val = z_List[0][i]
-                for j in range(len(model_list)):
-                    if z_List[j][i] > max_z_val:
-                        max_z_val = z_List[j][i]
-                max_z_list.append(max_z_val)
-
-            max_Z_List = np.array(max_z_list).reshape(X.shape)
+            max_z_list, _ = self.calculate_max_z(z_List)
+            max_Z_List = max_z_list.reshape(X.shape)
 
         # Get the callpath color map
         # dict_callpath_color = self.main_widget.get_callpath_color_map()
         # Set the x_label and y_label based on parameter selected.
-        x_label = self.main_widget.data_display.getAxisParameter(0).name
-        if x_label.startswith("_"):
-            x_label = x_label[1:]
-        y_label = self.main_widget.data_display.getAxisParameter(1).name
-        if y_label.startswith("_"):
-            y_label = y_label[1:]
+        x_label, y_label = self.get_axis_labels()
 
         # Draw plot showing max z value considering all the selected models
         number_of_subplots = 1
         ax = self.fig.add_subplot(
             1, number_of_subplots, number_of_subplots, projection='3d')
-        ax.mouse_init()
-        ax.xaxis.major.formatter._useMathText = True
-        ax.yaxis.major.formatter._useMathText = True
-        ax.zaxis.major.formatter._useMathText = True
+        ax.ticklabel_format(style='sci', useMathText=True)
         im = ax.plot_surface(X, Y, max_Z_List, cmap=self.colormap)
 
         ax.set_xlabel('\n' + x_label, linespacing=3.2)
@@ -42,12 +42,8 @@ class MeasurementPointsPlot(GraphDisplayWindow):
         parameter_y = self.main_widget.data_display.getAxisParameter(1)
 
         # Set the x_label and y_label based on parameter selected.
-        x_label = parameter_x.name
-        if x_label.startswith("_"):
-            x_label = x_label[1:]
-        y_label = parameter_y.name
-        if y_label.startswith("_"):
-            y_label = y_label[1:]
+        x_label = self.get_display_name(parameter_x.name)
+        y_label = self.get_display_name(parameter_y.name)
 
         # 1 because we are going to show all the models in same plot
         number_of_subplots = 1
@@ -84,22 +80,17 @@ class MeasurementPointsPlot(GraphDisplayWindow):
             ax_all.scatter(xs, ys, median, color=callpath_color, marker='+')
             ax_all.scatter(xs, ys, minimum, color=callpath_color, marker='_')
             ax_all.scatter(xs, ys, maximum, color=callpath_color, marker='_')
-            # Draw connecting line
-            line_x, line_y, line_z = [], [], []
-            for x, y, min_v, max_v in zip(xs, ys, minimum, maximum):
-                line_x.append(x), line_x.append(x)
-                line_y.append(y), line_y.append(y)
-                line_z.append(min_v), line_z.append(max_v)
-                line_x.append(np.nan), line_y.append(np.nan), line_z.append(np.nan)
+            # Draw connecting line, the segments from minimum to maximum are separated by nan
+            separator = np.full(len(xs), np.nan)
+            line_x = np.column_stack((xs, xs, separator)).ravel()
+            line_y = np.column_stack((ys, ys, separator)).ravel()
+            line_z = np.column_stack((minimum, maximum, separator)).ravel()
 
             ax_all.plot(line_x, line_y, line_z, color=callpath_color)
 
         # plot surfaces
         X, Y, Z_List, z_List = self.calculate_z_models(maxX, maxY, model_list, max_z)
-        ax_all.mouse_init()
-        ax_all.xaxis.major.formatter._useMathText = True
-        ax_all.yaxis.major.formatter._useMathText = True
-        ax_all.zaxis.major.formatter._useMathText = True
+        ax_all.ticklabel_format(style='sci', useMathText=True)
         ax_all.set_xlabel('\n' + x_label)
         ax_all.set_ylabel('\n' + y_label, linespacing=3.1)
         ax_all.set_zlabel(
@@ -17,7 +17,7 @@ from extrap.entities.functions import ConstantFunction
 from extrap.entities.functions import MultiParameterFunction
 from extrap.entities.hypotheses import ConstantHypothesis
 from extrap.entities.hypotheses import MultiParameterHypothesis
-from extrap.entities.measurement import Measurement, Measure
+from extrap.entities.measurement import Measurement, Measure, MeasurementBatch
 from extrap.entities.model import Model
 from extrap.entities.terms import MultiParameterTerm
 from extrap.modelers import single_parameter
@@ -204,7 +204,9 @@ class MultiParameterModeler(AbstractMultiParameterModeler, SingularModeler):
         # coordinates = list(dict.fromkeys(m.coordinate for m in measurements).keys())
 
         # use all available additional points for modeling the multi-parameter models
-        values = np.fromiter(Measurement.select_measure(measurements, self.use_measure), float, len(measurements))
+        # all hypotheses are fitted to the same measurements, their arrays are created only once
+        measurements = MeasurementBatch.from_measurements(measurements)
+        values = measurements.values(self.use_measure)
         meanModel = np.mean(values)
         constantCost = np.sum((values - meanModel) * (values - meanModel))
 
@@ -13,7 +13,7 @@ import numpy
 
 from extrap.entities.functions import ConstantFunction
 from extrap.entities.hypotheses import Hypothesis, SingleParameterHypothesis, MAX_HYPOTHESIS, ConstantHypothesis
-from extrap.entities.measurement import Measurement, Measure
+from extrap.entities.measurement import Measurement, Measure, MeasurementBatch
 from extrap.entities.parameter import Parameter
 from extrap.modelers.abstract_modeler import AbstractModeler
 from extrap.modelers.modeler_options import modeler_options
@@ -50,13 +50,12 @@ class AbstractSingleParameterModeler(AbstractModeler, ABC):
         # get the compound terms of the new hypothesis
         compound_terms = new.function.compound_terms
 
-        previous = numpy.seterr(divide='ignore', invalid='ignore')
-        # for all compound terms check if they are smaller than minimum allowed contribution
-        for term in compound_terms:
-            # ignore this hypothesis, since one of the terms contributes less than epsilon to the function
-            if term.coefficient == 0 or new.calc_term_contribution(term, measurements) < self.epsilon:
-                return False
-        numpy.seterr(**previous)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            # for all compound terms check if they are smaller than minimum allowed contribution
+            for term in compound_terms:
+                # ignore this hypothesis, since one of the terms contributes less than epsilon to the function
+                if term.coefficient == 0 or new.calc_term_contribution(term, measurements) < self.epsilon:
+                    return False
 
         # print smapes in debug mode
         logging.debug("next hypothesis SMAPE: %g RSS: %g", new.SMAPE, new.RSS)
@@ -65,13 +64,14 @@ class AbstractSingleParameterModeler(AbstractModeler, ABC):
             return new.RSS < old.RSS
         return new.SMAPE < old.SMAPE
 
-    def create_constant_model(self, measurements: Sequence[Measurement]) -> Tuple[ConstantHypothesis, float]:
+    def create_constant_model(self, measurements: Union[Sequence[Measurement], MeasurementBatch]
+                              ) -> Tuple[ConstantHypothesis, float]:
         """
         Creates a constant model that fits the data using a ConstantFunction.
         """
+        measurements = MeasurementBatch.from_measurements(measurements)
         # compute the constant coefficient
-        mean_model = numpy.mean(
-            numpy.fromiter(Measurement.select_measure(measurements, self.use_measure), float, len(measurements)))
+        mean_model = numpy.mean(measurements.values(self.use_measure))
 
         # create a constant function
         constant_function = ConstantFunction(mean_model)
@@ -83,12 +83,25 @@ class AbstractSingleParameterModeler(AbstractModeler, ABC):
 
         return constant_hypothesis, constant_cost
 
+    def compute_constant_cost(self, measurements: Union[Sequence[Measurement], MeasurementBatch]) -> float:
+        """
+        Computes the cost of the constant model, like create_constant_model, but without creating the model and
+        computing its other costs.
+        """
+        values = MeasurementBatch.from_measurements(measurements).values(self.use_measure)
+        difference = numpy.mean(values) - values
+        return float(numpy.dot(difference, difference))
+
     def find_best_hypothesis(self, candidate_hypotheses: Iterable[SH], constant_cost: float,
-                             measurements: Sequence[Measurement], current_best: H = MAX_HYPOTHESIS) -> Union[SH, H]:
+                             measurements: Union[Sequence[Measurement], MeasurementBatch],
+                             current_best: H = MAX_HYPOTHESIS) -> Union[SH, H]:
         """
         Searches for the best single parameter hypothesis and returns it.
         """
 
+        # all hypotheses are fitted to the same measurements, their arrays are created only once
+        measurements = MeasurementBatch.from_measurements(measurements)
+
         # currently the constant hypothesis is the best hypothesis
         best_hypothesis = current_best
 
@@ -97,26 +110,8 @@ class AbstractSingleParameterModeler(AbstractModeler, ABC):
         for i, next_hypothesis in enumerate(candidate_hypotheses):
 
             if self.use_crossvalidation:
-                # use leave one out cross validation
-                # cycle through points and leave one out per iteration
-                for element_id in range(len(measurements)):
-                    # copy measurements to create the training sets
-                    training_measurements = list(measurements)
-
-                    # remove one element the set
-                    training_measurements.pop(element_id)
-
-                    # validation set
-                    validation_measurement = measurements[element_id]
-
-                    # compute the model coefficients based on the training data
-                    next_hypothesis.compute_coefficients(training_measurements)
-
-                    # check if the constant coefficient should actually be 0
-                    next_hypothesis.clean_constant_coefficient(self.epsilon, training_measurements)
-
-                    # compute the cost of the single-parameter model for the validation data
-                    next_hypothesis.compute_cost_leave_one_out(training_measurements, validation_measurement)
+                # use leave one out cross validation, the cost is computed for all training sets at once
+                next_hypothesis.compute_cost_cross_validation(measurements, self.epsilon)
 
                 # compute the model coefficients using all data
                 next_hypothesis.compute_coefficients(measurements)
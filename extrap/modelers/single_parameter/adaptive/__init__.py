@@ -16,7 +16,7 @@ import numpy as np
 
 from extrap.entities.functions import SingleParameterFunction, ConstantFunction
 from extrap.entities.hypotheses import SingleParameterHypothesis, ConstantHypothesis
-from extrap.entities.measurement import Measurement, Measure
+from extrap.entities.measurement import Measurement, Measure, MeasurementBatch
 from extrap.entities.model import Model
 from extrap.entities.terms import CompoundTerm
 from extrap.modelers.modeler_options import modeler_options
@@ -130,8 +130,9 @@ class AdaptiveModeler(AbstractSingleParameterModeler):
                 hypothesis = ConstantHypothesis(ConstantFunction(), self.use_measure)
             else:
                 hypothesis = SingleParameterHypothesis(function, self.use_measure)
-            hypothesis.compute_coefficients(measurement_list[i])
-            hypothesis.compute_cost(measurement_list[i])
+            batch = MeasurementBatch.from_measurements(measurement_list[i])
+            hypothesis.compute_coefficients(batch)
+            hypothesis.compute_cost(batch)
             models.append(Model(hypothesis))
         return models
 
@@ -13,7 +13,7 @@ from typing import List, Sequence
 
 from extrap.entities.functions import SingleParameterFunction
 from extrap.entities.hypotheses import SingleParameterHypothesis
-from extrap.entities.measurement import Measurement, Measure
+from extrap.entities.measurement import Measurement, Measure, MeasurementBatch
 from extrap.entities.model import Model
 from extrap.entities.parameter import Parameter
 from extrap.entities.terms import CompoundTerm
@@ -274,8 +274,10 @@ class SingleParameterModeler(AbstractSingleParameterModeler, SingularModeler):
                           f"{self.min_measurement_points} in order to create a performance model.")
             # return None
 
+        batch = MeasurementBatch.from_measurements(measurements)
+
         # create a constant model
-        constant_hypothesis, constant_cost = self.create_constant_model(measurements)
+        constant_hypothesis, constant_cost = self.create_constant_model(batch)
         logging.debug("Constant model: %s", constant_hypothesis.function)
         logging.debug("Constant model cost: %g", constant_cost)
 
@@ -289,6 +291,6 @@ class SingleParameterModeler(AbstractSingleParameterModeler, SingularModeler):
             logging.debug("Searching for a single-parameter model.")
             # search for the best single parameter hypothesis
             hypotheses_generator = self.build_hypotheses(measurements)
-            best_hypothesis = self.find_best_hypothesis(hypotheses_generator, constant_cost, measurements,
+            best_hypothesis = self.find_best_hypothesis(hypotheses_generator, constant_cost, batch,
                                                         constant_hypothesis)
             return Model(best_hypothesis)
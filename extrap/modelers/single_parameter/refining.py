@@ -14,7 +14,7 @@ from typing import List, Tuple, Sequence
 from extrap.entities.fraction import Fraction
 from extrap.entities.functions import SingleParameterFunction
 from extrap.entities.hypotheses import SingleParameterHypothesis
-from extrap.entities.measurement import Measure
+from extrap.entities.measurement import Measure, MeasurementBatch
 from extrap.entities.model import Model
 from extrap.entities.terms import CompoundTerm
 from extrap.modelers.abstract_modeler import SingularModeler
@@ -56,8 +56,10 @@ class RefiningModeler(SingularModeler, AbstractSingleParameterModeler):
                 "Number of measurements needs to be at least 5 in order to create a performance model.")
             # return None
 
+        batch = MeasurementBatch.from_measurements(measurements)
+
         # compute a constant model
-        constant_hypothesis, constant_cost = self.create_constant_model(measurements)
+        constant_hypothesis, constant_cost = self.create_constant_model(batch)
 
         # use constant model when cost is 0
         if constant_cost == 0:
@@ -78,17 +80,17 @@ class RefiningModeler(SingularModeler, AbstractSingleParameterModeler):
 
         # create coarse hypotheses
         hypotheses = [self.find_best_hypothesis(self._build_hypotheses_generator(slice, ignore_constant=True),
-                                                constant_cost, measurements) for slice in slices]
+                                                constant_cost, batch) for slice in slices]
 
         # determine exponents for initial state
         state_per_slice = self._determine_initial_state(hypotheses, slices)
 
         # execute iterative refinement
-        best_hypothesis = self.iterative_refinement(hypotheses, state_per_slice, slices, constant_cost, measurements)
+        best_hypothesis = self.iterative_refinement(hypotheses, state_per_slice, slices, constant_cost, batch)
 
         # determine if improvement over constant model is enough
         term_contribution = best_hypothesis.calc_term_contribution(best_hypothesis.function.compound_terms[0],
-                                                                   measurements)
+                                                                   batch)
         improvement = constant_hypothesis.SMAPE / best_hypothesis.SMAPE
         if improvement < self.nonconstancy_threshold or term_contribution < self.epsilon:
             best_hypothesis = constant_hypothesis
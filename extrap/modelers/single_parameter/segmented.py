@@ -14,7 +14,7 @@ import numpy as np
 
 from extrap.entities.functions import SegmentedFunction
 from extrap.entities.hypotheses import SingleParameterHypothesis
-from extrap.entities.measurement import Measurement
+from extrap.entities.measurement import Measurement, MeasurementBatch
 from extrap.entities.model import SegmentedModel
 from extrap.modelers.modeler_options import modeler_options
 from extrap.modelers.single_parameter.basic import SingleParameterModeler
@@ -63,8 +63,9 @@ class SegmentedModeler(SingleParameterModeler):
         # create a model for each subset
         subset_hypotheses = []
         for subset in subsets:
+            subset_batch = MeasurementBatch.from_measurements(subset)
             # create a constant model
-            constant_hypothesis, constant_cost = self.create_constant_model(subset)
+            constant_hypothesis, constant_cost = self.create_constant_model(subset_batch)
 
             # use constant model when cost is 0
             if constant_cost == 0:
@@ -74,7 +75,7 @@ class SegmentedModeler(SingleParameterModeler):
             else:
                 # search for the best single parameter hypothesis
                 hypotheses_generator = self.build_hypotheses(subset)
-                best_hypothesis = self.find_best_hypothesis(hypotheses_generator, constant_cost, subset,
+                best_hypothesis = self.find_best_hypothesis(hypotheses_generator, constant_cost, subset_batch,
                                                             constant_hypothesis)
                 subset_hypotheses.append(best_hypothesis)
 
@@ -138,6 +139,7 @@ class SegmentedModeler(SingleParameterModeler):
 
         function = SegmentedFunction([m.hypothesis.function for m in models], intervals)
         hypothesis = SingleParameterHypothesis(function, self.use_measure)
-        hypothesis.compute_cost(measurements)
-        hypothesis.compute_adjusted_rsquared(self.create_constant_model(measurements)[1], measurements)
+        batch = MeasurementBatch.from_measurements(measurements)
+        hypothesis.compute_cost(batch)
+        hypothesis.compute_adjusted_rsquared(self.compute_constant_cost(batch), batch)
         return SegmentedModel(hypothesis, models, change_point)
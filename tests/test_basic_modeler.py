@@ -93,6 +93,23 @@ class TestBasicModeler(TestCaseWithFunctionAssertions):
             self.assertEqual(1, len(models))
             self.assertApproxFunction(function, models[0].hypothesis.function)
 
+    def test_modeling_measurements_changed_in_place(self):
+        points = [2, 4, 8, 16, 32]
+        measurements = [Measurement(Coordinate(p), None, None, 200 + 10 * p) for p in points]
+        modeler = SingleParameterModeler()
+        term = CompoundTerm.create(1, 1, 0)
+        term.coefficient = 10
+        function = SingleParameterFunction(term)
+        function.constant_coefficient = 200
+        self.assertApproxFunction(function, modeler.model([measurements])[0].hypothesis.function)
+
+        # the measurements are scaled in place, e.g., by the strong scaling conversion
+        for m in measurements:
+            m *= 2
+        term.coefficient = 20
+        function.constant_coefficient = 400
+        self.assertApproxFunction(function, modeler.model([measurements])[0].hypothesis.function)
+
     def test_modeling2(self):
         for exponents in [(0, 1, 1), (0, 1, 2), (1, 4, 0), (1, 2, 0), (1, 2, 1), (1, 2, 2), (2, 3, 0), (1, 1, 0),
                           (1, 1, 1), (1, 1, 2), (5, 4, 0), (4, 3, 0), (3, 2, 0), (5, 3, 0), (7, 4, 0), (2, 1, 0),
@@ -299,3 +316,10 @@ class TestBasicModeler(TestCaseWithFunctionAssertions):
             models = modeler.model([measurements])
             self.assertEqual(1, len(models))
             self.assertApproxFunction(function, models[0].hypothesis.function, places=3)
+
+    def test_compute_constant_cost(self):
+        measurements = [Measurement(Coordinate(p), None, None, v) for p, v in [(1, 3), (2, 5), (4, 4), (8, 12)]]
+        modeler = SingleParameterModeler()
+        _, constant_cost = modeler.create_constant_model(measurements)
+        self.assertEqual(constant_cost, modeler.compute_constant_cost(measurements))
+        self.assertAlmostEqual(50, modeler.compute_constant_cost(measurements))
@@ -5,17 +5,24 @@
 # This software may be modified and distributed under the terms of a BSD-style license.
 # See the LICENSE file in the base directory for details.
 
+import logging
+import signal
 import sys
+import threading
 import unittest
 import warnings
 
-from PySide6.QtCore import QRect, QItemSelectionModel
+from PySide6.QtCore import QRect, QItemSelectionModel, QCoreApplication
 from PySide6.QtWidgets import QApplication, QCheckBox, QPushButton
 
+from extrap.entities.callpath import Callpath
+from extrap.entities.calltree import Node
 from extrap.extrap import extrapgui
 from extrap.fileio.file_reader.text_file_reader import TextFileReader
 from extrap.gui.AdvancedPlotWidget import AdvancedPlotWidget
-from extrap.gui.MainWidget import MainWidget, QCoreApplication
+from extrap.gui.MainWidget import MainWidget
+from extrap.gui.TreeModel import TreeItemFilterProvider
+from extrap.gui.components.worker import run_in_background
 
 _qapp_instance = None
 
@@ -119,6 +126,28 @@ class TestGuiExperimentLoaded(TestGuiCommon):
                 self.assertIsNotNone(p.graphDisplayWindow)
                 QCoreApplication.processEvents()
 
+    def test_deep_call_tree(self):
+        experiment = self.window.getExperiment()
+        item_filter = self.window.selector_widget.tree_model.item_filter
+        display_types = [TreeItemFilterProvider.DisplayType.INCLUDE, TreeItemFilterProvider.DisplayType.COMPACT,
+                         TreeItemFilterProvider.DisplayType.FLAT]
+        row_counts = {}
+        for display_type in display_types:
+            item_filter.display_type = display_type
+            row_counts[display_type] = self.window.selector_widget.tree_model.rowCount()
+
+        node = experiment.call_tree
+        for i in range(sys.getrecursionlimit() + 100):
+            child = Node(f"deep{i}", Callpath.EMPTY)
+            node.add_child_node(child)
+            node = child
+        # only the deepest node has a model, so each display type shows the new branch as one additional row
+        node.path = experiment.callpaths[0]
+        item_filter.setup(experiment.call_tree)
+        for display_type in display_types:
+            item_filter.display_type = display_type
+            self.assertEqual(row_counts[display_type] + 1, self.window.selector_widget.tree_model.rowCount())
+
     def test_modeler_options_reset(self):
         modeler_widget = self.window.modeler_widget
         modeler_widget._options_container.toggle(False)
@@ -189,6 +218,53 @@ class TestGuiLoadExperiment(GuiTestCase):
             sys.excepthook = _old_exception_handler
 
 
+class TestGuiBackgroundTask(GuiTestCase):
+    def test_warnings_and_log_records_in_calling_thread(self):
+        def task():
+            warnings.warn("background warning")
+            logging.warning("background log record")
+            return threading.get_ident()
+
+        shown_warnings = []
+        handled_records = []
+
+        class _RecordingHandler(logging.Handler):
+            def emit(self, record):
+                handled_records.append((str(record.msg), threading.get_ident()))
+
+        _old_warnings_handler = warnings.showwarning
+        warnings.showwarning = lambda message, *args, **kwargs: shown_warnings.append(
+            (str(message), threading.get_ident()))
+        handler = _RecordingHandler()
+        logging.getLogger().addHandler(handler)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('always')
+                task_thread = run_in_background(task)
+        finally:
+            logging.getLogger().removeHandler(handler)
+            warnings.showwarning = _old_warnings_handler
+
+        self.assertNotEqual(threading.get_ident(), task_thread)
+        self.assertEqual([("background warning", threading.get_ident())], shown_warnings)
+        self.assertIn(("background log record", threading.get_ident()), handled_records)
+
+
+class TestGuiSigintHandler(GuiTestCase):
+    def test_sigint_handler_restored_on_close(self):
+        previous_handler = signal.getsignal(signal.SIGINT)
+        previous_wakeup_fd = signal.set_wakeup_fd(-1)
+        signal.set_wakeup_fd(previous_wakeup_fd)
+
+        window = MainWidget()
+        window.hide()
+        self.assertIsNot(previous_handler, signal.getsignal(signal.SIGINT))
+        window.close()
+
+        self.assertIs(previous_handler, signal.getsignal(signal.SIGINT))
+        self.assertEqual(previous_wakeup_fd, signal.set_wakeup_fd(previous_wakeup_fd))
+
+
 class TestGuiNoExperiment(TestGuiCommon):
     def test_generator_button(self):
         self.assertFalse(self.window.modeler_widget._model_button.isEnabled())
@@ -5,13 +5,14 @@
 # This software may be modified and distributed under the terms of a BSD-style license.
 # See the LICENSE file in the base directory for details.
 
+import math
 import unittest
 
 from numpy import ma
 from numpy.testing import assert_array_equal
 
 from extrap.entities.coordinate import Coordinate
-from extrap.entities.measurement import Measurement
+from extrap.entities.measurement import Measurement, Measure, MeasurementBatch
 
 
 class TestMeasurement(unittest.TestCase):
@@ -94,6 +95,21 @@ class TestMeasurement(unittest.TestCase):
         self.assertAlmostEqual(0.48989, m.std, places=3)
         self.assertEqual(5, m.repetitions)
 
+    def test_statistics(self):
+        c = Coordinate(1, 2, 3)
+        m = Measurement(c, "test", "metric", [4, 1, 3, 2])
+        self.assertEqual(2.5, m.mean)
+        self.assertEqual(2.5, m.median)
+        self.assertEqual(1, m.minimum)
+        self.assertEqual(4, m.maximum)
+        self.assertAlmostEqual(1.11803, m.std, places=3)
+
+        m = Measurement(c, "test", "metric", [1, float('nan'), 3])
+        self.assertTrue(math.isnan(m.mean))
+        self.assertTrue(math.isnan(m.median))
+        self.assertTrue(math.isnan(m.minimum))
+        self.assertTrue(math.isnan(m.maximum))
+
     def test_nested_list(self):
         c = Coordinate(1, 2, 3)
         values = [[1, 1, 1], [2, 2, 2]]
@@ -222,3 +238,37 @@ class TestMeasurement(unittest.TestCase):
                                         [[1, 1, 1], [1, 1, 0], [0, 0, 0]]])
         assert_array_equal(expected_array, m.values)
         self.assertEqual(3, m.repetitions)
+
+
+class TestMeasurementBatch(unittest.TestCase):
+    def test_arrays(self):
+        measurements = [Measurement(Coordinate(p, p * 2), "test", "metric", [p, p + 1, p + 5]) for p in range(1, 5)]
+        batch = MeasurementBatch.from_measurements(measurements)
+        self.assertEqual(4, len(batch))
+        self.assertEqual(2, batch.dimensions)
+        assert_array_equal([[1, 2], [2, 4], [3, 6], [4, 8]], batch.coordinates)
+        assert_array_equal([[1, 2, 3, 4], [2, 4, 6, 8]], batch.points)
+        assert_array_equal([1, 2, 3, 4], batch.first_parameter_points)
+        assert_array_equal([3, 4, 5, 6], batch.means)
+        assert_array_equal([2, 3, 4, 5], batch.medians)
+        assert_array_equal([1, 2, 3, 4], batch.values(Measure.MINIMUM))
+        self.assertFalse(batch.points.flags.writeable)
+        self.assertFalse(batch.means.flags.writeable)
+
+    def test_from_measurements(self):
+        measurements = [Measurement(Coordinate(p), "test", "metric", p) for p in range(1, 5)]
+        batch = MeasurementBatch.from_measurements(measurements)
+        self.assertIs(batch, MeasurementBatch.from_measurements(batch))
+        assert_array_equal([1, 2, 3, 4], batch.means)
+
+        measurements.append(Measurement(Coordinate(5), "test", "metric", 5))
+        changed_batch = MeasurementBatch.from_measurements(measurements)
+        self.assertIsNot(batch, changed_batch)
+        assert_array_equal([1, 2, 3, 4, 5], changed_batch.means)
+
+    def test_from_measurements_changed_in_place(self):
+        measurements = [Measurement(Coordinate(p), "test", "metric", p * 10) for p in [1, 2, 4, 8]]
+        assert_array_equal([10, 20, 40, 80], MeasurementBatch.from_measurements(measurements).values(Measure.MEAN))
+        for m in measurements:
+            m *= 2
+        assert_array_equal([20, 40, 80, 160], MeasurementBatch.from_measurements(measurements).values(Measure.MEAN))
@@ -5,10 +5,16 @@
 # This software may be modified and distributed under the terms of a BSD-style license.
 # See the LICENSE file in the base directory for details.
 
+import copy
+
 from extrap.entities.callpath import Callpath
+from extrap.entities.coordinate import Coordinate
+from extrap.entities.functions import ConstantFunction, SingleParameterFunction
 from extrap.entities.hypotheses import ConstantHypothesis
 from extrap.entities.hypotheses import SingleParameterHypothesis
+from extrap.entities.measurement import Measurement, Measure
 from extrap.entities.metric import Metric
+from extrap.entities.terms import CompoundTerm
 from extrap.fileio.file_reader.text_file_reader import TextFileReader
 from extrap.modelers.model_generator import ModelGenerator
 from tests.modelling_testcase import TestCaseWithFunctionAssertions
@@ -81,3 +87,36 @@ class TestModeling(TestCaseWithFunctionAssertions):
         for model in experiment.modelers[0].models.values():
             self.assertApproxFunction(first.hypothesis.function, model.hypothesis.function)
             self.assertEqual(first.hypothesis, model.hypothesis)
+
+    def test_hypothesis_follows_changed_measurements(self):
+        measurements = [Measurement(Coordinate(p), Callpath('test'), Metric(''), p * 2) for p in range(1, 6)]
+        hypothesis = ConstantHypothesis(ConstantFunction(), Measure.MEAN)
+        hypothesis.compute_coefficients(measurements)
+        self.assertAlmostEqual(6, hypothesis.function.constant_coefficient)
+
+        measurements[0] = Measurement(Coordinate(1), Callpath('test'), Metric(''), 12)
+        hypothesis.compute_coefficients(measurements)
+        self.assertAlmostEqual(8, hypothesis.function.constant_coefficient)
+
+        measurements.append(Measurement(Coordinate(6), Callpath('test'), Metric(''), 20))
+        hypothesis.compute_coefficients(measurements)
+        self.assertAlmostEqual(10, hypothesis.function.constant_coefficient)
+
+    def test_cross_validation_cost(self):
+        measurements = [Measurement(Coordinate(p), Callpath('test'), Metric(''), 3 * p ** 2 + p + 5 + (p % 3))
+                        for p in range(1, 9)]
+        for terms in [(CompoundTerm.create(2, 1, 0),), (CompoundTerm.create(2, 1, 0), CompoundTerm.create(1, 1, 1))]:
+            expected = SingleParameterHypothesis(SingleParameterFunction(*copy.deepcopy(terms)), Measure.MEAN)
+            for i in range(len(measurements)):
+                training_measurements = measurements[:i] + measurements[i + 1:]
+                expected.compute_coefficients(training_measurements)
+                expected.clean_constant_coefficient(1e-3, training_measurements)
+                expected.compute_cost_leave_one_out(training_measurements, measurements[i])
+
+            hypothesis = SingleParameterHypothesis(SingleParameterFunction(*copy.deepcopy(terms)), Measure.MEAN)
+            hypothesis.compute_cost_cross_validation(measurements, 1e-3)
+            self.assertAlmostEqual(expected.RSS, hypothesis.RSS)
+            self.assertAlmostEqual(expected.nRSS, hypothesis.nRSS)
+            self.assertAlmostEqual(expected.rRSS, hypothesis.rRSS)
+            self.assertAlmostEqual(expected.RE, hypothesis.RE)
+            self.assertAlmostEqual(expected.SMAPE, hypothesis.SMAPE)